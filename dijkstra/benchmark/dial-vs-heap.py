@@ -0,0 +1,107 @@
+import numpy as np
+import os
+import sys
+import time
+from tabulate import tabulate
+from typing import Dict, List
+
+# Tambahkan folder dijkstra ke sys.path agar paket dijkstra_graph dapat di-import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dijkstra_graph import Dijkstra_CSR_Graph
+
+# Parameter benchmark: graf grid (mirip jaringan jalan) dengan bobot integer kecil
+grid_width: int = 300  # Jumlah kolom grid
+grid_height: int = 300  # Jumlah baris grid
+weight_maximum: int = 20  # Bobot edge terbesar (bobot acak 1..weight_maximum)
+query_amount: int = 5  # Jumlah query single-source untuk setiap solver
+seed: int = 42
+
+rng: np.random.Generator = np.random.default_rng(seed)
+
+# Bangun edge dua arah antar tetangga grid secara vektor
+ids: np.ndarray = np.arange(grid_width * grid_height).reshape(grid_height, grid_width)
+from_ids: np.ndarray = np.concatenate(
+    [ids[:, :-1].ravel(), ids[:, 1:].ravel(), ids[:-1, :].ravel(), ids[1:, :].ravel()]
+)
+to_ids: np.ndarray = np.concatenate(
+    [ids[:, 1:].ravel(), ids[:, :-1].ravel(), ids[1:, :].ravel(), ids[:-1, :].ravel()]
+)
+
+graph = Dijkstra_CSR_Graph.from_edge_arrays(
+    from_ids.astype(str),
+    to_ids.astype(str),
+    rng.integers(1, weight_maximum + 1, len(from_ids)),
+)
+sources: List[int] = rng.integers(0, graph.vertex_count, query_amount).tolist()
+
+print(
+    f"Graf grid {grid_width}x{grid_height}: {graph.vertex_count} vertex, {graph.edge_count} edge, "
+    f"bobot integer 1..{weight_maximum}, solver otomatis: "
+    f"{'dial' if graph.prefers_dial_solver() else 'heap'}"
+)
+
+# Jalankan setiap solver untuk sumber yang sama dan catat waktunya
+mean_durations: Dict[str, float] = {}
+checksums: Dict[str, float] = {}
+for solver in ("heap", "vectorized", "dial"):
+    durations: List[float] = []
+    checksum: float = 0
+    for source in sources:
+        start_time: float = time.perf_counter()
+        distances, _ = graph.shortest_path_ids(source, solver=solver)
+        durations.append(time.perf_counter() - start_time)
+        checksum += sum(distances)
+
+    mean_durations[solver] = float(np.mean(durations))
+    checksums[solver] = checksum
+
+# Pastikan seluruh solver menghasilkan jarak yang sama
+if len(set(checksums.values())) != 1:
+    raise RuntimeError(f"Hasil solver berbeda: {checksums}")
+
+table: List[List[str]] = [
+    [
+        solver,
+        f"{duration * 1000:.1f}",
+        f"{mean_durations['heap'] / duration:.2f}x",
+    ]
+    for solver, duration in mean_durations.items()
+]
+
+print(
+    tabulate(
+        table,
+        headers=["Solver", "Rata-rata (ms)", "Percepatan vs heap"],
+        tablefmt="fancy_grid",
+        colalign=("center", "center", "center"),
+    )
+)
+
+# Regresi: graf rantai dengan bobot integer besar, solver otomatis tidak boleh memilih Dial
+# dan Dial sendiri tidak boleh jauh lebih lambat dari heap karena bucket kosong dilompati
+chain_length: int = 2000
+chain_graph = Dijkstra_CSR_Graph.from_edge_arrays(
+    np.arange(chain_length - 1).astype(str),
+    np.arange(1, chain_length).astype(str),
+    rng.integers(20000, 60001, chain_length - 1).astype(float),
+)
+if chain_graph.prefers_dial_solver():
+    raise RuntimeError("Solver otomatis memilih Dial untuk bobot integer besar")
+
+chain_durations: Dict[str, float] = {}
+for solver in ("auto", "heap", "dial"):
+    start_time = time.perf_counter()
+    chain_graph.shortest_path_ids(0, solver=solver)
+    chain_durations[solver] = time.perf_counter() - start_time
+
+if chain_durations["dial"] > 50 * chain_durations["heap"] + 0.1:
+    raise RuntimeError(f"Dial terlalu lambat untuk bobot besar: {chain_durations}")
+
+print(
+    f"Graf rantai {chain_length} vertex, bobot integer 20000..60000: "
+    + ", ".join(
+        f"{solver} {duration * 1000:.1f} ms"
+        for solver, duration in chain_durations.items()
+    )
+)
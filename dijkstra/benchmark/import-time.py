@@ -0,0 +1,74 @@
+import os
+import statistics
+import subprocess
+import sys
+from tabulate import tabulate
+from typing import Dict, List
+
+# Folder dijkstra berisi paket dijkstra_graph
+package_directory: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Parameter benchmark: setiap skenario dijalankan di interpreter baru (cold start) beberapa kali
+repeat_amount: int = 7
+
+# Skenario import yang dibandingkan, "seperti sebelumnya" meniru import networkx, matplotlib, dan tabulate
+# yang dulu dijalankan di awal modul
+scenarios: Dict[str, str] = {
+    "python kosong": "pass",
+    "numpy": "import numpy",
+    "dijkstra_graph": "import dijkstra_graph",
+    "dijkstra_graph + plot/tabel (seperti sebelumnya)": (
+        "import dijkstra_graph, networkx, tabulate; from matplotlib import pyplot"
+    ),
+}
+
+
+# Fungsi untuk mengukur waktu menjalankan kode di interpreter baru, dalam milidetik
+def measure(code: str) -> float:
+    timing_code: str = (
+        "import time; start_time = time.perf_counter(); "
+        f"{code}; print(time.perf_counter() - start_time)"
+    )
+
+    output: str = subprocess.run(
+        [sys.executable, "-c", timing_code],
+        cwd=package_directory,
+        env={**os.environ, "MPLBACKEND": "Agg"},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    return float(output) * 1000
+
+
+# Pastikan import paket tidak ikut memuat pustaka plot dan tabel
+loaded_modules: str = subprocess.run(
+    [
+        sys.executable,
+        "-c",
+        "import sys, dijkstra_graph; "
+        "print([name for name in ('networkx', 'matplotlib', 'tabulate') if name in sys.modules])",
+    ],
+    cwd=package_directory,
+    capture_output=True,
+    text=True,
+    check=True,
+).stdout.strip()
+
+if loaded_modules != "[]":
+    raise RuntimeError(f"Import dijkstra_graph ikut memuat {loaded_modules}")
+
+table: List[List[str]] = []
+for name, code in scenarios.items():
+    durations: List[float] = [measure(code) for _ in range(repeat_amount)]
+    table.append([name, f"{statistics.median(durations):.1f}", f"{min(durations):.1f}"])
+
+print(
+    tabulate(
+        table,
+        headers=["Skenario", "Median (ms)", "Minimum (ms)"],
+        tablefmt="fancy_grid",
+        colalign=("left", "center", "center"),
+    )
+)
@@ -0,0 +1,20 @@
+# Paket solver jalur terpendek Dijkstra
+# Import paket hanya memuat NumPy dan pustaka standar; networkx, matplotlib, dan tabulate
+# baru di-import saat visualisasi atau tabel langkah pertama kali dipakai
+from .contraction import Contraction_Hierarchy
+from .csr import Dijkstra_CSR_Graph
+from .dynamic import Dynamic_Shortest_Path_Tree
+from .graph import Dijkstra_Graph
+from .sharded import Sharded_Dijkstra_Graph
+from .trace import Dijkstra_CSV_Sink, Dijkstra_JSONL_Sink, Dijkstra_Trace
+
+__all__ = [
+    "Contraction_Hierarchy",
+    "Dijkstra_CSR_Graph",
+    "Dijkstra_CSV_Sink",
+    "Dijkstra_Graph",
+    "Dijkstra_JSONL_Sink",
+    "Dijkstra_Trace",
+    "Dynamic_Shortest_Path_Tree",
+    "Sharded_Dijkstra_Graph",
+]
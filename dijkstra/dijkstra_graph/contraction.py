@@ -0,0 +1,373 @@
+import heapq
+import numpy as np
+from typing import Dict, List, Tuple
+
+from .csr import Dijkstra_CSR_Graph, _load_npz_arrays
+
+# Nama array CSR pada contraction hierarchy (dipakai untuk edge naik dan edge turun)
+_CH_ARRAY_KEYS: Tuple[str, ...] = ("offsets", "targets", "weights", "middles")
+
+
+# Fungsi pencarian witness untuk contraction hierarchy: Dijkstra terbatas dari source tanpa melewati excluded
+def _witness_search(
+    out_edges: List[Dict[int, float]],
+    source: int,
+    excluded: int,
+    max_distance: float,
+    max_settled: int,
+) -> Dict[int, float]:
+    distances: Dict[int, float] = {source: 0}
+    heap: List[Tuple[float, int]] = [(0, source)]
+    settled_count: int = 0
+    while heap:
+        distance, current_vertex = heapq.heappop(heap)
+        if distance > distances[current_vertex]:
+            continue
+
+        # Batasi pencarian berdasarkan jarak dan jumlah vertex yang dikunjungi
+        settled_count += 1
+        if distance > max_distance or settled_count > max_settled:
+            break
+
+        for neighbor, weight in out_edges[current_vertex].items():
+            if neighbor == excluded:
+                continue
+
+            new_distance: float = distance + weight
+            if new_distance < distances.get(neighbor, float("inf")):
+                distances[neighbor] = new_distance
+                heapq.heappush(heap, (new_distance, neighbor))
+
+    return distances
+
+
+# Fungsi untuk menyusun array CSR (offsets, targets, weights, middles) dari daftar edge per vertex
+def _edge_lists_to_csr(
+    edge_lists: List[List[Tuple[int, float, int]]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    offsets: np.ndarray = np.zeros(len(edge_lists) + 1, dtype=np.int64)
+    np.cumsum([len(edges) for edges in edge_lists], out=offsets[1:])
+
+    flat: List[Tuple[int, float, int]] = [
+        edge for edges in edge_lists for edge in edges
+    ]
+
+    return (
+        offsets,
+        np.array([edge[0] for edge in flat], dtype=np.int32),
+        np.array([edge[1] for edge in flat], dtype=np.float64),
+        np.array([edge[2] for edge in flat], dtype=np.int32),
+    )
+
+
+# Kelas contraction hierarchy (CH): praproses urutan vertex dan edge shortcut untuk query yang sangat cepat
+# Query hanya menelusuri edge ke vertex dengan rank lebih tinggi dari kedua arah, lalu shortcut dibongkar kembali
+class Contraction_Hierarchy:
+    def __init__(
+        self,
+        names: np.ndarray,
+        rank: np.ndarray,
+        up: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+        down: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    ) -> None:
+        self.names: np.ndarray = names  # Nama vertex berdasarkan id
+        self.rank: np.ndarray = rank  # Urutan kontraksi setiap vertex
+
+        # Edge u -> w dengan rank[u] < rank[w], disimpan pada u (offsets, targets, weights, middles)
+        self.up_offsets, self.up_targets, self.up_weights, self.up_middles = up
+
+        # Edge u -> w dengan rank[u] > rank[w], disimpan terbalik pada w dengan target u
+        (
+            self.down_offsets,
+            self.down_targets,
+            self.down_weights,
+            self.down_middles,
+        ) = down
+
+        self._index: Dict[str, int] | None = None
+
+        # Jumlah vertex yang dikunjungi (settled) pada query terakhir
+        self.settled_count: int = 0
+
+    # Fungsi praproses untuk membangun hierarchy dari graf CSR
+    # Urutan kontraksi memakai prioritas edge difference + jumlah tetangga yang sudah dikontraksi (lazy update)
+    @classmethod
+    def build(
+        cls, graph: "Dijkstra_CSR_Graph", max_settled: int = 500
+    ) -> "Contraction_Hierarchy":
+        vertex_count: int = graph.vertex_count
+
+        out_edges: List[Dict[int, float]] = [{} for _ in range(vertex_count)]
+        in_edges: List[Dict[int, float]] = [{} for _ in range(vertex_count)]
+
+        # Semua edge asli dan shortcut: (u, w) -> (bobot, vertex tengah atau -1 untuk edge asli)
+        all_edges: Dict[Tuple[int, int], Tuple[float, int]] = {}
+
+        offsets: List[int] = graph.offsets.tolist()
+        targets: List[int] = graph.targets.tolist()
+        weights: List[float] = graph.weights.tolist()
+        for u in range(vertex_count):
+            for index in range(offsets[u], offsets[u + 1]):
+                w, weight = targets[index], weights[index]
+                if u == w:
+                    continue
+
+                out_edges[u][w] = weight
+                in_edges[w][u] = weight
+                all_edges[(u, w)] = (weight, -1)
+
+        # Fungsi untuk mencari shortcut yang dibutuhkan jika vertex dikontraksi
+        def find_shortcuts(vertex: int) -> List[Tuple[int, int, float]]:
+            shortcuts: List[Tuple[int, int, float]] = []
+            if not out_edges[vertex]:
+                return shortcuts
+
+            max_out: float = max(out_edges[vertex].values())
+            for u, in_weight in in_edges[vertex].items():
+                distances: Dict[int, float] = _witness_search(
+                    out_edges, u, vertex, in_weight + max_out, max_settled
+                )
+
+                for w, out_weight in out_edges[vertex].items():
+                    if w == u:
+                        continue
+
+                    # Shortcut hanya dibutuhkan jika tidak ada jalur witness yang sama pendek
+                    if distances.get(w, float("inf")) > in_weight + out_weight:
+                        shortcuts.append((u, w, in_weight + out_weight))
+
+            return shortcuts
+
+        contracted_neighbors: List[int] = [0] * vertex_count
+
+        def priority(vertex: int, shortcuts: List[Tuple[int, int, float]]) -> int:
+            return (
+                len(shortcuts)
+                - len(in_edges[vertex])
+                - len(out_edges[vertex])
+                + contracted_neighbors[vertex]
+            )
+
+        heap: List[Tuple[int, int]] = [
+            (priority(vertex, find_shortcuts(vertex)), vertex)
+            for vertex in range(vertex_count)
+        ]
+        heapq.heapify(heap)
+
+        rank: np.ndarray = np.empty(vertex_count, dtype=np.int32)
+        order: int = 0
+        while heap:
+            _, vertex = heapq.heappop(heap)
+
+            # Lazy update: hitung ulang prioritas, tunda jika bukan lagi yang terkecil
+            shortcuts: List[Tuple[int, int, float]] = find_shortcuts(vertex)
+            current_priority: int = priority(vertex, shortcuts)
+            if heap and current_priority > heap[0][0]:
+                heapq.heappush(heap, (current_priority, vertex))
+                continue
+
+            for u, w, weight in shortcuts:
+                if weight < out_edges[u].get(w, float("inf")):
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+                    all_edges[(u, w)] = (weight, vertex)
+
+            # Hapus vertex dari graf yang tersisa
+            for u in in_edges[vertex]:
+                del out_edges[u][vertex]
+                contracted_neighbors[u] += 1
+
+            for w in out_edges[vertex]:
+                del in_edges[w][vertex]
+                contracted_neighbors[w] += 1
+
+            in_edges[vertex] = {}
+            out_edges[vertex] = {}
+
+            rank[vertex] = order
+            order += 1
+
+        up_lists: List[List[Tuple[int, float, int]]] = [[] for _ in range(vertex_count)]
+        down_lists: List[List[Tuple[int, float, int]]] = [
+            [] for _ in range(vertex_count)
+        ]
+        for (u, w), (weight, middle) in all_edges.items():
+            if rank[u] < rank[w]:
+                up_lists[u].append((w, weight, middle))
+
+            else:
+                down_lists[w].append((u, weight, middle))
+
+        return cls(
+            graph.names,
+            rank,
+            _edge_lists_to_csr(up_lists),
+            _edge_lists_to_csr(down_lists),
+        )
+
+    # Fungsi untuk menyimpan hierarchy ke file .npz tanpa kompresi agar tidak perlu dibangun ulang
+    def save_npz(self, file_path: str) -> None:
+        np.savez(
+            file_path,
+            names=self.names,
+            rank=self.rank,
+            up_offsets=self.up_offsets,
+            up_targets=self.up_targets,
+            up_weights=self.up_weights,
+            up_middles=self.up_middles,
+            down_offsets=self.down_offsets,
+            down_targets=self.down_targets,
+            down_weights=self.down_weights,
+            down_middles=self.down_middles,
+        )
+
+    # Fungsi untuk memuat hierarchy dari file .npz (array di-memory-map)
+    @classmethod
+    def load_npz(cls, file_path: str, mmap: bool = True) -> "Contraction_Hierarchy":
+        arrays: Dict[str, np.ndarray] = _load_npz_arrays(file_path, mmap)
+
+        return cls(
+            arrays["names"],
+            arrays["rank"],
+            tuple(arrays[f"up_{key}"] for key in _CH_ARRAY_KEYS),
+            tuple(arrays[f"down_{key}"] for key in _CH_ARRAY_KEYS),
+        )
+
+    # Fungsi untuk menerjemahkan nama vertex menjadi id integer
+    def vertex_id(self, vertex: str) -> int:
+        if self._index is None:
+            self._index = {str(name): i for i, name in enumerate(self.names)}
+
+        if vertex not in self._index:
+            raise ValueError(f"Vertex '{vertex}' tidak ada di dalam graf")
+
+        return self._index[vertex]
+
+    # Fungsi untuk mencari vertex tengah dari edge (u, w) di hierarchy (-1 jika edge asli)
+    def _edge_middle(self, u: int, w: int) -> int:
+        if self.rank[u] < self.rank[w]:
+            offsets, targets, middles, owner, other = (
+                self.up_offsets,
+                self.up_targets,
+                self.up_middles,
+                u,
+                w,
+            )
+
+        else:
+            offsets, targets, middles, owner, other = (
+                self.down_offsets,
+                self.down_targets,
+                self.down_middles,
+                w,
+                u,
+            )
+
+        start, end = offsets[owner], offsets[owner + 1]
+        index: int = start + targets[start:end].tolist().index(other)
+
+        return int(middles[index])
+
+    # Fungsi untuk membongkar edge shortcut menjadi urutan vertex pada graf asli (tanpa vertex awal)
+    def _unpack_edge(self, u: int, w: int, middle: int) -> List[int]:
+        path: List[int] = []
+        stack: List[Tuple[int, int, int]] = [(u, w, middle)]
+        while stack:
+            u, w, middle = stack.pop()
+            if middle == -1:
+                path.append(w)
+                continue
+
+            # Bongkar (u, middle) lebih dulu, sehingga (middle, w) didorong ke stack terlebih dahulu
+            stack.append((middle, w, self._edge_middle(middle, w)))
+            stack.append((u, middle, self._edge_middle(u, middle)))
+
+        return path
+
+    # Fungsi query CH, mengembalikan (jarak, jalur) yang sama dengan Dijkstra_Graph.shortest_path
+    def shortest_path(
+        self, start_vertex: str, end_vertex: str
+    ) -> Tuple[float, List[str]]:
+        source: int = self.vertex_id(start_vertex)
+        target: int = self.vertex_id(end_vertex)
+
+        # Index 0 untuk pencarian maju (edge naik), index 1 untuk pencarian mundur (edge turun terbalik)
+        graphs = (
+            (self.up_offsets, self.up_targets, self.up_weights, self.up_middles),
+            (
+                self.down_offsets,
+                self.down_targets,
+                self.down_weights,
+                self.down_middles,
+            ),
+        )
+        distances: Tuple[Dict[int, float], Dict[int, float]] = (
+            {source: 0},
+            {target: 0},
+        )
+        previous_vertices: Tuple[Dict[int, Tuple[int, int]], Dict] = ({}, {})
+        heaps: List[List[Tuple[float, int]]] = [[(0, source)], [(0, target)]]
+        settled: Tuple[set[int], set[int]] = (set(), set())
+
+        best_distance: float = float("inf")
+        meeting_vertex: int = -1
+        self.settled_count = 0
+        while heaps[0] or heaps[1]:
+            # Pilih arah dengan kunci teratas terkecil, arah yang kuncinya >= jarak terbaik dihentikan
+            side: int = min(
+                (side for side in (0, 1) if heaps[side]),
+                key=lambda side: heaps[side][0][0],
+            )
+            if heaps[side][0][0] >= best_distance:
+                break
+
+            distance, current_vertex = heapq.heappop(heaps[side])
+            if current_vertex in settled[side]:
+                continue
+
+            settled[side].add(current_vertex)
+            self.settled_count += 1
+
+            if current_vertex in distances[1 - side]:
+                total: float = distance + distances[1 - side][current_vertex]
+                if total < best_distance:
+                    best_distance = total
+                    meeting_vertex = current_vertex
+
+            offsets, targets, weights, middles = graphs[side]
+            start, end = offsets[current_vertex], offsets[current_vertex + 1]
+            for neighbor, weight, middle in zip(
+                targets[start:end].tolist(),
+                weights[start:end].tolist(),
+                middles[start:end].tolist(),
+            ):
+                new_distance: float = distance + weight
+                if new_distance < distances[side].get(neighbor, float("inf")):
+                    distances[side][neighbor] = new_distance
+                    previous_vertices[side][neighbor] = (current_vertex, middle)
+                    heapq.heappush(heaps[side], (new_distance, neighbor))
+
+        if meeting_vertex == -1:
+            return float("inf"), []
+
+        # Rangkai edge hierarchy dari vertex awal ke titik temu lalu ke vertex akhir
+        forward_edges: List[Tuple[int, int, int]] = []
+        current_vertex = meeting_vertex
+        while current_vertex != source:
+            previous_vertex, middle = previous_vertices[0][current_vertex]
+            forward_edges.append((previous_vertex, current_vertex, middle))
+            current_vertex = previous_vertex
+
+        forward_edges.reverse()
+
+        current_vertex = meeting_vertex
+        while current_vertex != target:
+            next_vertex, middle = previous_vertices[1][current_vertex]
+            forward_edges.append((current_vertex, next_vertex, middle))
+            current_vertex = next_vertex
+
+        path: List[int] = [source]
+        for u, w, middle in forward_edges:
+            path.extend(self._unpack_edge(u, w, middle))
+
+        return best_distance, [str(self.names[vertex]) for vertex in path]
@@ -0,0 +1,913 @@
+import heapq
+import math
+import numpy as np
+import os
+import struct
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from multiprocessing import shared_memory
+
+    from .graph import Dijkstra_Graph
+
+
+# Fungsi untuk membaca array dari file .npz, dengan memory-map jika file disimpan tanpa kompresi
+# np.load mengabaikan mmap_mode untuk .npz, sehingga setiap anggota zip dipetakan langsung dari offset datanya
+def _load_npz_arrays(file_path: str, mmap: bool = True) -> Dict[str, np.ndarray]:
+    if not mmap:
+        with np.load(file_path) as data:
+            return {key: data[key] for key in data.files}
+
+    import zipfile
+
+    arrays: Dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(file_path) as archive, open(file_path, "rb") as file:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(
+                    "Hanya file .npz tanpa kompresi (np.savez) yang dapat di-memory-map"
+                )
+
+            # Lewati local file header zip (30 byte + panjang nama file + panjang extra field)
+            file.seek(info.header_offset)
+            name_length, extra_length = struct.unpack("<HH", file.read(30)[26:30])
+            file.seek(info.header_offset + 30 + name_length + extra_length)
+
+            # Baca header .npy untuk mendapatkan bentuk dan tipe data array
+            version: Tuple[int, int] = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+
+            if dtype.hasobject:
+                raise ValueError("Array bertipe object tidak dapat di-memory-map")
+
+            key: str = info.filename.removesuffix(".npy")
+            if int(np.prod(shape)) == 0:
+                arrays[key] = np.empty(shape, dtype=dtype)
+                continue
+
+            arrays[key] = np.memmap(
+                file_path,
+                dtype=dtype,
+                mode="r",
+                shape=shape,
+                order="F" if fortran_order else "C",
+                offset=file.tell(),
+            )
+
+    return arrays
+
+
+# Fungsi untuk membaca file teks berkolom (CSV/TSV) menjadi array string berbentuk (baris, kolom)
+# Komentar (#) dan baris kosong dibuang sebelum np.loadtxt, sehingga file berkomentar dimuat tanpa UserWarning
+def _load_text_table(
+    file_path: str, delimiter: str, skip_header: bool, column_count: int = 3
+) -> np.ndarray:
+    with open(file_path, encoding="utf-8") as file:
+        lines: List[str] = file.read().splitlines()[int(skip_header) :]
+
+    rows: List[str] = []
+    for line in lines:
+        line = line.split("#", 1)[0]
+        if line.strip():
+            rows.append(line)
+
+    if not rows:
+        return np.empty((0, column_count), dtype=str)
+
+    return np.loadtxt(rows, dtype=str, delimiter=delimiter, comments=None, ndmin=2)
+
+
+# Fungsi Dijkstra berbasis heap yang bekerja pada id integer dari array CSR
+# Mengembalikan list jarak, list id vertex sebelumnya (-1 jika tidak ada), dan jumlah vertex yang dikunjungi
+# Jika target diberikan (bukan -1), pencarian berhenti begitu target dikunjungi
+def _csr_dijkstra(
+    offsets: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+    source: int,
+    target: int = -1,
+) -> Tuple[List[float], List[int], int]:
+    vertex_count: int = len(offsets) - 1
+    distances: List[float] = [float("inf")] * vertex_count
+    previous_vertices: List[int] = [-1] * vertex_count
+    visited: List[bool] = [False] * vertex_count
+
+    # Jarak awal mengikuti tipe bobot agar seluruh jarak pada graf berbobot float bertipe float
+    distances[source] = 0.0 if weights.dtype.kind == "f" else 0
+    settled_count: int = 0
+    heap: List[Tuple[float, int]] = [(distances[source], source)]
+    while heap:
+        distance, current_vertex = heapq.heappop(heap)
+
+        # Lewati entri usang (lazy decrease-key)
+        if visited[current_vertex]:
+            continue
+
+        visited[current_vertex] = True
+        settled_count += 1
+        if current_vertex == target:
+            break
+
+        # Ambil potongan tetangga vertex saat ini sekaligus dari array CSR
+        start, end = offsets[current_vertex], offsets[current_vertex + 1]
+        for neighbor, weight in zip(
+            targets[start:end].tolist(), weights[start:end].tolist()
+        ):
+            new_distance: float = distance + weight
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                previous_vertices[neighbor] = current_vertex
+                heapq.heappush(heap, (new_distance, neighbor))
+
+    return distances, previous_vertices, settled_count
+
+
+# Fungsi Dijkstra berbasis heap dengan relaksasi edge secara vektor (NumPy) pada array CSR
+# Seluruh potongan tetangga vertex dengan derajat >= min_degree direlaksasi sekaligus (np.minimum dan mask),
+# vertex berderajat kecil tetap memakai loop biasa karena overhead NumPy lebih besar dari manfaatnya
+# Edge paralel (target edge ganda pada satu vertex) diperbolehkan, bobot terkecil dipilih oleh np.minimum.at
+def _csr_dijkstra_vectorized(
+    offsets: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+    source: int,
+    target: int = -1,
+    min_degree: int = 16,
+) -> Tuple[List[float], List[int], int]:
+    vertex_count: int = len(offsets) - 1
+    distances: np.ndarray = np.full(vertex_count, np.inf)
+    previous_vertices: np.ndarray = np.full(vertex_count, -1, dtype=np.int64)
+    visited: List[bool] = [False] * vertex_count
+
+    distances[source] = 0
+    settled_count: int = 0
+    heap: List[Tuple[float, int]] = [(0.0, source)]
+    while heap:
+        distance, current_vertex = heapq.heappop(heap)
+
+        # Lewati entri usang (lazy decrease-key)
+        if visited[current_vertex]:
+            continue
+
+        visited[current_vertex] = True
+        settled_count += 1
+        if current_vertex == target:
+            break
+
+        start, end = offsets[current_vertex], offsets[current_vertex + 1]
+        if end - start >= min_degree:
+            # Relaksasi seluruh tetangga sekaligus, hanya tetangga yang membaik masuk ke heap
+            # np.minimum.at mengambil bobot terkecil jika ada beberapa edge ke tetangga yang sama,
+            # entri heap ganda untuk tetangga tersebut dilewati oleh pemeriksaan visited
+            neighbors: np.ndarray = targets[start:end]
+            candidate_distances: np.ndarray = distance + weights[start:end]
+            improved: np.ndarray = candidate_distances < distances[neighbors]
+
+            improved_neighbors: np.ndarray = neighbors[improved]
+            np.minimum.at(distances, improved_neighbors, candidate_distances[improved])
+            previous_vertices[improved_neighbors] = current_vertex
+
+            for new_distance, neighbor in zip(
+                distances[improved_neighbors].tolist(), improved_neighbors.tolist()
+            ):
+                heapq.heappush(heap, (new_distance, neighbor))
+
+            continue
+
+        for neighbor, weight in zip(
+            targets[start:end].tolist(), weights[start:end].tolist()
+        ):
+            new_distance: float = distance + weight
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                previous_vertices[neighbor] = current_vertex
+                heapq.heappush(heap, (new_distance, neighbor))
+
+    return distances.tolist(), previous_vertices.tolist(), settled_count
+
+
+# Batas bobot terbesar agar solver bucket (Dial) dapat dipakai, jumlah bucket = bobot terbesar + 1
+_DIAL_MAX_WEIGHT: int = 1 << 16
+
+
+# Fungsi Dijkstra berbasis bucket (algoritma Dial) untuk bobot edge integer tidak negatif
+# Bucket melingkar berukuran bobot terbesar + 1 menggantikan heap, sedangkan heap kecil berisi jarak bucket
+# yang terisi dipakai untuk melompat langsung ke bucket tidak kosong berikutnya tanpa memeriksa bucket kosong
+# satu per satu, sehingga waktu query O(E + jumlah jarak berbeda * log) dan tidak bergantung pada jarak terjauh
+def _csr_dial(
+    offsets: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+    source: int,
+    target: int = -1,
+) -> Tuple[List[float], List[int], int]:
+    vertex_count: int = len(offsets) - 1
+    distances: List[float] = [float("inf")] * vertex_count
+    previous_vertices: List[int] = [-1] * vertex_count
+    visited: List[bool] = [False] * vertex_count
+
+    bucket_count: int = (int(weights.max()) if len(weights) else 0) + 1
+    buckets: List[List[int]] = [[] for _ in range(bucket_count)]
+
+    distances[source] = 0
+    buckets[0].append(source)
+    # Jarak bucket yang terisi, setiap bucket hanya berisi satu jarak karena seluruh entri
+    # berada di rentang [jarak saat ini, jarak saat ini + bobot terbesar]
+    bucket_distances: List[int] = [0]
+    settled_count: int = 0
+    while bucket_distances:
+        current_distance: int = heapq.heappop(bucket_distances)
+        bucket: List[int] = buckets[current_distance % bucket_count]
+        while bucket:
+            current_vertex: int = bucket.pop()
+
+            # Lewati entri usang yang jaraknya sudah diperbaiki ke bucket lain
+            if visited[current_vertex] or distances[current_vertex] != current_distance:
+                continue
+
+            visited[current_vertex] = True
+            settled_count += 1
+            if current_vertex == target:
+                return distances, previous_vertices, settled_count
+
+            start, end = offsets[current_vertex], offsets[current_vertex + 1]
+            for neighbor, weight in zip(
+                targets[start:end].tolist(), weights[start:end].tolist()
+            ):
+                new_distance: int = current_distance + weight
+                if new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    previous_vertices[neighbor] = current_vertex
+
+                    # Catat jarak bucket saat bucket pertama kali terisi, bucket yang sudah
+                    # dikosongkan sebelum jaraknya diambil dari heap cukup dilewati
+                    next_bucket: List[int] = buckets[new_distance % bucket_count]
+                    if not next_bucket:
+                        heapq.heappush(bucket_distances, new_distance)
+
+                    next_bucket.append(neighbor)
+
+    return distances, previous_vertices, settled_count
+
+
+# Array bersama (shared memory) yang dipasang di setiap proses worker oleh _attach_shared_arrays
+_worker_arrays: Dict[str, Tuple["shared_memory.SharedMemory", np.ndarray]] = {}
+
+
+# Fungsi initializer worker untuk memasang array bersama tanpa proses pickling data graf
+# specs berisi nama blok shared memory, bentuk array, dan tipe datanya
+def _attach_shared_arrays(specs: Dict[str, Tuple[str, Tuple[int, ...], str]]) -> None:
+    from multiprocessing import shared_memory
+
+    for key, (name, shape, dtype) in specs.items():
+        # Worker berbagi resource tracker dengan proses induk, sehingga blok tetap dilepas oleh induk
+        block = shared_memory.SharedMemory(name=name)
+        _worker_arrays[key] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+
+# Fungsi worker untuk menghitung beberapa baris matriks jarak langsung ke shared memory
+def _distance_matrix_rows(rows: List[Tuple[int, int]]) -> int:
+    offsets: np.ndarray = _worker_arrays["offsets"][1]
+    targets: np.ndarray = _worker_arrays["targets"][1]
+    weights: np.ndarray = _worker_arrays["weights"][1]
+    distance_rows: np.ndarray = _worker_arrays["distances"][1]
+    predecessor_rows: np.ndarray = _worker_arrays["predecessors"][1]
+
+    for row, source in rows:
+        distances, previous_vertices, _ = _csr_dijkstra(
+            offsets, targets, weights, source
+        )
+
+        distance_rows[row] = distances
+        predecessor_rows[row] = previous_vertices
+
+    return len(rows)
+
+
+# Kelas graf beku (tidak dapat diubah) dengan penyimpanan compressed sparse row (CSR)
+# Nama vertex dipetakan ke id integer, tetangga vertex i berada pada targets[offsets[i]:offsets[i + 1]]
+class Dijkstra_CSR_Graph:
+    def __init__(
+        self,
+        names: np.ndarray,
+        offsets: np.ndarray,
+        targets: np.ndarray,
+        weights: np.ndarray,
+        position_x: np.ndarray,
+        position_y: np.ndarray,
+    ) -> None:
+        if len(offsets) != len(names) + 1:
+            raise ValueError("Panjang offsets harus jumlah vertex + 1")
+
+        if len(targets) != len(weights) or len(targets) != offsets[-1]:
+            raise ValueError(
+                "Panjang targets dan weights harus sama dengan offsets[-1]"
+            )
+
+        # Graf menyimpan view dari setiap array, sehingga pembekuan tidak membuat
+        # array milik pemanggil ikut menjadi read-only
+        self.names: np.ndarray = names.view()  # Nama vertex berdasarkan id
+        self.offsets: np.ndarray = (
+            offsets.view()
+        )  # Awal potongan tetangga setiap vertex
+        self.targets: np.ndarray = targets.view()  # Id vertex tujuan setiap edge
+        self.weights: np.ndarray = weights.view()  # Bobot setiap edge
+        self.position_x: np.ndarray = position_x.view()  # Posisi X setiap vertex
+        self.position_y: np.ndarray = position_y.view()  # Posisi Y setiap vertex
+
+        # Bekukan seluruh array agar graf tidak dapat diubah setelah dibangun
+        for array in (
+            self.names,
+            self.offsets,
+            self.targets,
+            self.weights,
+            self.position_x,
+            self.position_y,
+        ):
+            array.flags.writeable = False
+
+        # Pemetaan nama ke id dibangun saat pertama kali dibutuhkan
+        self._index: Dict[str, int] | None = None
+
+        # Salinan bobot bertipe integer untuk solver Dial (False jika bobot bukan integer kecil)
+        self._integer_weights: np.ndarray | bool | None = None
+
+        # Hasil pengecekan apakah solver "auto" memilih Dial, dihitung saat pertama kali dibutuhkan
+        self._dial_preferred: bool | None = None
+
+        # Graf terbalik yang dibangun saat pertama kali dibutuhkan
+        self._reverse: "Dijkstra_CSR_Graph | None" = None
+
+        # Jumlah vertex yang dikunjungi (settled) pada pencarian terakhir
+        self.settled_count: int = 0
+
+    # Fungsi untuk membangun graf CSR dari Dijkstra_Graph (urutan vertex dan edge dipertahankan)
+    @classmethod
+    def from_graph(cls, graph: "Dijkstra_Graph") -> "Dijkstra_CSR_Graph":
+        names: List[str] = list(graph.vertices.keys())
+        index: Dict[str, int] = {name: i for i, name in enumerate(names)}
+
+        degrees: List[int] = []
+        targets: List[int] = []
+        weights: List[float] = []
+        for name in names:
+            edges: Dict[str, float] = graph.vertices[name]["edges"]
+            degrees.append(len(edges))
+            targets.extend(index[neighbor] for neighbor in edges)
+            weights.extend(edges.values())
+
+        offsets: np.ndarray = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+
+        return cls(
+            np.array(names, dtype=str),
+            offsets,
+            np.array(targets, dtype=np.int32),
+            np.array(weights, dtype=np.float64),
+            np.array(
+                [graph.vertices[name]["position_x"] for name in names],
+                dtype=np.float64,
+            ),
+            np.array(
+                [graph.vertices[name]["position_y"] for name in names],
+                dtype=np.float64,
+            ),
+        )
+
+    # Fungsi untuk membangun graf CSR dari array edge secara vektor (tanpa add_vertex/add_edge per elemen)
+    # Edge duplikat mengikuti perilaku add_edge, yaitu bobot terakhir yang dipakai
+    @classmethod
+    def from_edge_arrays(
+        cls,
+        from_vertices: np.ndarray,
+        to_vertices: np.ndarray,
+        weights: np.ndarray,
+        names: np.ndarray | None = None,
+        position_x: np.ndarray | None = None,
+        position_y: np.ndarray | None = None,
+    ) -> "Dijkstra_CSR_Graph":
+        from_vertices = np.asarray(from_vertices, dtype=str)
+        to_vertices = np.asarray(to_vertices, dtype=str)
+        weights = np.asarray(weights, dtype=np.float64)
+        edge_count: int = len(weights)
+
+        if len(from_vertices) != edge_count or len(to_vertices) != edge_count:
+            raise ValueError("Jumlah vertex asal, vertex tujuan, dan bobot harus sama")
+
+        if np.any(weights < 0):
+            raise ValueError("Bobot edge tidak boleh negatif")
+
+        if names is None:
+            # Nama vertex diambil dari edge, id ditentukan oleh urutan nama yang terurut
+            names, inverse = np.unique(
+                np.concatenate([from_vertices, to_vertices]), return_inverse=True
+            )
+            from_ids: np.ndarray = inverse[:edge_count]
+            to_ids: np.ndarray = inverse[edge_count:]
+
+        else:
+            # Terjemahkan nama edge ke id dengan pencarian biner pada daftar vertex yang terurut
+            # Nama disalin agar perubahan array milik pemanggil tidak mengubah graf
+            names = np.array(names, dtype=str)
+            sorter: np.ndarray = np.argsort(names, kind="stable")
+            sorted_names: np.ndarray = names[sorter]
+            if edge_count and len(names) == 0:
+                raise ValueError("Edge merujuk vertex yang tidak ada di daftar vertex")
+
+            ids: List[np.ndarray] = []
+            for vertices in (from_vertices, to_vertices):
+                positions: np.ndarray = np.searchsorted(sorted_names, vertices).clip(
+                    0, max(len(names) - 1, 0)
+                )
+                if edge_count and np.any(sorted_names[positions] != vertices):
+                    raise ValueError(
+                        "Edge merujuk vertex yang tidak ada di daftar vertex"
+                    )
+
+                ids.append(sorter[positions])
+
+            from_ids, to_ids = ids
+
+        vertex_count: int = len(names)
+
+        # Hapus edge duplikat dengan mempertahankan kemunculan terakhir,
+        # hasil np.unique sekaligus terurut berdasarkan (vertex asal, vertex tujuan)
+        keys: np.ndarray = from_ids.astype(np.int64) * vertex_count + to_ids
+        _, last_index = np.unique(keys[::-1], return_index=True)
+        keep: np.ndarray = edge_count - 1 - last_index
+
+        offsets: np.ndarray = np.zeros(vertex_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(from_ids[keep], minlength=vertex_count), out=offsets[1:])
+
+        return cls(
+            names,
+            offsets,
+            to_ids[keep].astype(np.int32),
+            weights[keep],
+            (
+                np.zeros(vertex_count)
+                if position_x is None
+                else np.array(position_x, dtype=np.float64)
+            ),
+            (
+                np.zeros(vertex_count)
+                if position_y is None
+                else np.array(position_y, dtype=np.float64)
+            ),
+        )
+
+    # Fungsi untuk memuat graf dari file edge list CSV/TSV (kolom: asal, tujuan, bobot)
+    # File vertex opsional berisi kolom: nama, posisi_x, posisi_y
+    @classmethod
+    def from_edge_list(
+        cls,
+        file_path: str,
+        delimiter: str | None = None,
+        vertex_file_path: str | None = None,
+        skip_header: bool = False,
+    ) -> "Dijkstra_CSR_Graph":
+        # Tentukan pemisah kolom dari ekstensi file jika tidak diberikan
+        if delimiter is None:
+            delimiter = "\t" if file_path.endswith(".tsv") else ","
+
+        # Parsing seluruh file sekaligus menjadi array string
+        edges: np.ndarray = _load_text_table(file_path, delimiter, skip_header)
+        if edges.shape[1] < 3:
+            raise ValueError("Edge list harus memiliki kolom asal, tujuan, dan bobot")
+
+        names, position_x, position_y = None, None, None
+        if vertex_file_path is not None:
+            vertices: np.ndarray = _load_text_table(
+                vertex_file_path, delimiter, skip_header
+            )
+
+            names = vertices[:, 0]
+            position_x = vertices[:, 1].astype(np.float64)
+            position_y = vertices[:, 2].astype(np.float64)
+
+        return cls.from_edge_arrays(
+            np.char.strip(edges[:, 0]),
+            np.char.strip(edges[:, 1]),
+            edges[:, 2].astype(np.float64),
+            None if names is None else np.char.strip(names),
+            position_x,
+            position_y,
+        )
+
+    # Fungsi untuk menyimpan graf ke format biner .npz tanpa kompresi (dapat di-memory-map)
+    def save_npz(self, file_path: str) -> None:
+        np.savez(
+            file_path,
+            names=self.names,
+            offsets=self.offsets,
+            targets=self.targets,
+            weights=self.weights,
+            position_x=self.position_x,
+            position_y=self.position_y,
+        )
+
+    # Fungsi untuk memuat graf dari file .npz, array di-memory-map sehingga file besar terbuka seketika
+    @classmethod
+    def load_npz(cls, file_path: str, mmap: bool = True) -> "Dijkstra_CSR_Graph":
+        arrays: Dict[str, np.ndarray] = _load_npz_arrays(file_path, mmap)
+
+        return cls(
+            arrays["names"],
+            arrays["offsets"],
+            arrays["targets"],
+            arrays["weights"],
+            arrays["position_x"],
+            arrays["position_y"],
+        )
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    # Fungsi untuk menerjemahkan nama vertex menjadi id integer
+    def vertex_id(self, vertex: str) -> int:
+        if self._index is None:
+            self._index = {str(name): i for i, name in enumerate(self.names)}
+
+        if vertex not in self._index:
+            raise ValueError(f"Vertex '{vertex}' tidak ada di dalam graf")
+
+        return self._index[vertex]
+
+    # Fungsi untuk menerjemahkan id integer menjadi nama vertex
+    def vertex_name(self, vertex_id: int) -> str:
+        return str(self.names[vertex_id])
+
+    # Fungsi untuk menyusun jalur (dalam nama vertex) dari list vertex sebelumnya
+    def build_path(self, previous_vertices: List[int], end_id: int) -> List[str]:
+        path: List[str] = []
+        current_vertex: int = end_id
+        while current_vertex != -1:
+            path.append(self.vertex_name(current_vertex))
+            current_vertex = previous_vertices[current_vertex]
+
+        path.reverse()
+
+        return path
+
+    # Fungsi untuk mengecek apakah seluruh bobot edge adalah integer tidak negatif yang cukup kecil untuk Dial
+    def has_small_integer_weights(self) -> bool:
+        if self._integer_weights is None:
+            self._integer_weights = False
+            if np.all(self.weights >= 0) and np.all(self.weights % 1 == 0):
+                if len(self.weights) == 0 or self.weights.max() <= _DIAL_MAX_WEIGHT:
+                    self._integer_weights = self.weights.astype(np.int64)
+
+        return self._integer_weights is not False
+
+    # Fungsi untuk mengecek apakah solver "auto" sebaiknya memakai Dial
+    # Dial membuat bobot terbesar + 1 bucket per query dan unggul karena banyak vertex berbagi jarak yang sama,
+    # sehingga hanya dipilih jika bobot terbesar lebih kecil dari jumlah vertex; bobot integer besar memakai heap
+    def prefers_dial_solver(self) -> bool:
+        if self._dial_preferred is None:
+            self._dial_preferred = self.has_small_integer_weights() and (
+                len(self.weights) == 0 or self.weights.max() < self.vertex_count
+            )
+
+        return self._dial_preferred
+
+    # Fungsi untuk menjalankan Dijkstra pada id integer
+    # Solver "heap" memakai binary heap, "vectorized" merelaksasi tetangga vertex berderajat tinggi dengan NumPy,
+    # "dial" memakai bucket untuk bobot integer, dan "auto" memilih "dial" jika bobot integer kecil
+    # dibanding jumlah vertex (lihat prefers_dial_solver)
+    def shortest_path_ids(
+        self, source: int, target: int = -1, solver: str = "auto"
+    ) -> Tuple[List[float], List[int]]:
+        if solver not in ("auto", "heap", "vectorized", "dial"):
+            raise ValueError(
+                f"Solver '{solver}' tidak dikenal, "
+                "gunakan 'auto', 'heap', 'vectorized', atau 'dial'"
+            )
+
+        if solver == "auto":
+            solver = "dial" if self.prefers_dial_solver() else "heap"
+
+        if solver == "dial":
+            if not self.has_small_integer_weights():
+                raise ValueError(
+                    "Solver 'dial' membutuhkan bobot integer tidak negatif "
+                    f"maksimal {_DIAL_MAX_WEIGHT}"
+                )
+
+            distances, previous_vertices, self.settled_count = _csr_dial(
+                self.offsets, self.targets, self._integer_weights, source, target
+            )
+
+            # Dial menghitung dengan salinan bobot integer, kembalikan jarak ke tipe bobot graf
+            # agar hasilnya sama dengan solver lain (misalnya 3.0, bukan 3, untuk bobot float)
+            if self.weights.dtype.kind == "f":
+                distances = np.asarray(distances, dtype=self.weights.dtype).tolist()
+
+        else:
+            distances, previous_vertices, self.settled_count = (
+                _csr_dijkstra_vectorized if solver == "vectorized" else _csr_dijkstra
+            )(self.offsets, self.targets, self.weights, source, target)
+
+        return distances, previous_vertices
+
+    # Fungsi untuk mencari jalur terpendek, nama vertex hanya diterjemahkan di batas API
+    # Jika stop_at_end bernilai True, pencarian berhenti begitu vertex akhir dikunjungi
+    def shortest_path(
+        self,
+        start_vertex: str,
+        end_vertex: str,
+        stop_at_end: bool = True,
+        solver: str = "auto",
+    ) -> Tuple[float, List[str]]:
+        start_id: int = self.vertex_id(start_vertex)
+
+        # Tanpa vertex akhir, kembalikan semua jarak seperti Dijkstra_Graph.shortest_path
+        if end_vertex is None:
+            distances, _ = self.shortest_path_ids(start_id, solver=solver)
+
+            return {
+                self.vertex_name(vertex_id): distance
+                for vertex_id, distance in enumerate(distances)
+            }
+
+        end_id: int = self.vertex_id(end_vertex)
+        distances, previous_vertices = self.shortest_path_ids(
+            start_id, end_id if stop_at_end else -1, solver
+        )
+
+        if distances[end_id] == float("inf"):
+            return float("inf"), []
+
+        return distances[end_id], self.build_path(previous_vertices, end_id)
+
+    # Fungsi untuk membangun graf CSR terbalik (setiap edge u -> w menjadi w -> u), disimpan setelah dibuat
+    def reverse(self) -> "Dijkstra_CSR_Graph":
+        if self._reverse is None:
+            order: np.ndarray = np.argsort(self.targets, kind="stable")
+            sources: np.ndarray = np.repeat(
+                np.arange(self.vertex_count, dtype=np.int32), np.diff(self.offsets)
+            )
+
+            offsets: np.ndarray = np.zeros(self.vertex_count + 1, dtype=np.int64)
+            np.cumsum(
+                np.bincount(self.targets, minlength=self.vertex_count),
+                out=offsets[1:],
+            )
+
+            self._reverse = Dijkstra_CSR_Graph(
+                self.names,
+                offsets,
+                sources[order],
+                self.weights[order],
+                self.position_x,
+                self.position_y,
+            )
+
+        return self._reverse
+
+    # Fungsi untuk mendapatkan bobot edge u -> w
+    def edge_weight(self, u: int, w: int) -> float:
+        start, end = self.offsets[u], self.offsets[u + 1]
+
+        return float(self.weights[start + self.targets[start:end].tolist().index(w)])
+
+    # Fungsi pencarian spur untuk Yen: A* dari source ke target pada tampilan graf dengan vertex/edge terlarang
+    # Jarak ke target pada pohon jalur terpendek terbalik menjadi heuristik yang konsisten (menghapus edge hanya
+    # memperpanjang jarak); jika jalur pohon dari vertex yang dikunjungi tidak melewati larangan, jalur itu langsung dipakai
+    def _spur_search(
+        self,
+        source: int,
+        target: int,
+        remaining: List[float],
+        next_vertices: List[int],
+        banned_vertices: set[int],
+        banned_edges: set[Tuple[int, int]],
+    ) -> Tuple[float, List[int]] | None:
+        distances: Dict[int, float] = {source: 0}
+        previous_vertices: Dict[int, int] = {}
+        settled: set[int] = set()
+        heap: List[Tuple[float, int]] = [(remaining[source], source)]
+
+        # Jalur pohon tidak boleh kembali ke spur atau vertex root agar hasil tetap tanpa loop
+        blocked_vertices: set[int] = banned_vertices | {source}
+
+        # Status bebas-larangan jalur pohon setiap vertex, disimpan agar tiap vertex hanya ditelusuri sekali
+        clear: Dict[int, bool] = {target: True}
+        while heap:
+            _, current_vertex = heapq.heappop(heap)
+            if current_vertex in settled:
+                continue
+
+            settled.add(current_vertex)
+
+            # Cek apakah jalur pohon dari vertex ini ke target bebas dari larangan
+            walked: List[int] = []
+            vertex: int = current_vertex
+            while vertex not in clear:
+                next_vertex: int = next_vertices[vertex]
+                if (
+                    next_vertex in blocked_vertices
+                    or (vertex, next_vertex) in banned_edges
+                ):
+                    clear[vertex] = False
+                    break
+
+                walked.append(vertex)
+                vertex = next_vertex
+
+            for walked_vertex in walked:
+                clear[walked_vertex] = clear[vertex]
+
+            if clear[current_vertex]:
+                path: List[int] = [current_vertex]
+                while path[-1] != source:
+                    path.append(previous_vertices[path[-1]])
+
+                path.reverse()
+                while path[-1] != target:
+                    path.append(next_vertices[path[-1]])
+
+                return distances[current_vertex] + remaining[current_vertex], path
+
+            start, end = self.offsets[current_vertex], self.offsets[current_vertex + 1]
+            for neighbor, weight in zip(
+                self.targets[start:end].tolist(), self.weights[start:end].tolist()
+            ):
+                if (
+                    neighbor in banned_vertices
+                    or (current_vertex, neighbor) in banned_edges
+                    or remaining[neighbor] == float("inf")
+                ):
+                    continue
+
+                new_distance: float = distances[current_vertex] + weight
+                if new_distance < distances.get(neighbor, float("inf")):
+                    distances[neighbor] = new_distance
+                    previous_vertices[neighbor] = current_vertex
+                    heapq.heappush(heap, (new_distance + remaining[neighbor], neighbor))
+
+        return None
+
+    # Fungsi untuk mencari k jalur terpendek tanpa loop (algoritma Yen), terurut dari yang terpendek
+    # Mengembalikan list (jarak, jalur); bisa kurang dari k jika jalur alternatif tidak tersedia
+    def k_shortest_paths(
+        self, start_vertex: str, end_vertex: str, k: int
+    ) -> List[Tuple[float, List[str]]]:
+        source: int = self.vertex_id(start_vertex)
+        target: int = self.vertex_id(end_vertex)
+
+        # Pohon jalur terpendek terbalik dari target: jarak sisa dan vertex berikutnya menuju target
+        reverse: Dijkstra_CSR_Graph = self.reverse()
+        remaining, next_vertices, _ = _csr_dijkstra(
+            reverse.offsets, reverse.targets, reverse.weights, target
+        )
+
+        if k < 1 or remaining[source] == float("inf"):
+            return []
+
+        first_path: List[int] = [source]
+        while first_path[-1] != target:
+            first_path.append(next_vertices[first_path[-1]])
+
+        paths: List[Tuple[float, List[int]]] = [(remaining[source], first_path)]
+        candidates: List[Tuple[float, List[int]]] = []
+        seen: set[Tuple[int, ...]] = {tuple(first_path)}
+        while len(paths) < k:
+            _, previous_path = paths[-1]
+
+            root_distance: float = 0
+            for index in range(len(previous_path) - 1):
+                spur_vertex: int = previous_path[index]
+                root_path: List[int] = previous_path[: index + 1]
+
+                # Larang edge berikutnya dari jalur terpilih yang memiliki root yang sama
+                banned_edges: set[Tuple[int, int]] = {
+                    (path[index], path[index + 1])
+                    for _, path in paths
+                    if len(path) > index + 1 and path[: index + 1] == root_path
+                }
+
+                # Larang vertex root (kecuali spur) agar jalur tetap tanpa loop
+                banned_vertices: set[int] = set(root_path[:-1])
+
+                spur = self._spur_search(
+                    spur_vertex,
+                    target,
+                    remaining,
+                    next_vertices,
+                    banned_vertices,
+                    banned_edges,
+                )
+
+                if spur is not None:
+                    spur_distance, spur_path = spur
+                    candidate: List[int] = root_path[:-1] + spur_path
+                    if tuple(candidate) not in seen:
+                        seen.add(tuple(candidate))
+                        heapq.heappush(
+                            candidates, (root_distance + spur_distance, candidate)
+                        )
+
+                root_distance += self.edge_weight(spur_vertex, previous_path[index + 1])
+
+            if not candidates:
+                break
+
+            paths.append(heapq.heappop(candidates))
+
+        return [
+            (distance, [self.vertex_name(vertex) for vertex in path])
+            for distance, path in paths
+        ]
+
+    # Fungsi untuk menghitung matriks jarak dari banyak sumber sekaligus
+    # Mengembalikan matriks jarak (sumber x vertex) dan matriks id vertex sebelumnya (-1 jika tidak ada)
+    # Sumber dibagi ke ProcessPoolExecutor, array graf dan hasil dibagikan lewat shared memory
+    def distance_matrix(
+        self,
+        sources: List[str],
+        workers: int | None = None,
+        chunk_size: int | None = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        source_ids: List[int] = [self.vertex_id(source) for source in sources]
+        shape: Tuple[int, int] = (len(source_ids), self.vertex_count)
+
+        workers = workers or os.cpu_count() or 1
+        workers = min(workers, max(len(source_ids), 1))
+        if chunk_size is None:
+            chunk_size = max(1, math.ceil(len(source_ids) / (workers * 4)))
+
+        # Tanpa paralelisme, hitung langsung di proses ini
+        if workers == 1:
+            distances: np.ndarray = np.empty(shape, dtype=np.float64)
+            predecessors: np.ndarray = np.empty(shape, dtype=np.int32)
+            for row, source in enumerate(source_ids):
+                distances[row], predecessors[row], _ = _csr_dijkstra(
+                    self.offsets, self.targets, self.weights, source
+                )
+
+            return distances, predecessors
+
+        # Modul multiprocessing hanya di-import jika perhitungan benar-benar dibagi ke beberapa proses
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        arrays: Dict[str, np.ndarray] = {
+            "offsets": self.offsets,
+            "targets": self.targets,
+            "weights": self.weights,
+            "distances": np.empty(shape, dtype=np.float64),
+            "predecessors": np.empty(shape, dtype=np.int32),
+        }
+
+        blocks: Dict[str, shared_memory.SharedMemory] = {}
+        try:
+            # Salin array graf ke shared memory dan siapkan blok untuk hasil
+            specs: Dict[str, Tuple[str, Tuple[int, ...], str]] = {}
+            for key, array in arrays.items():
+                blocks[key] = shared_memory.SharedMemory(
+                    create=True, size=max(array.nbytes, 1)
+                )
+                shared: np.ndarray = np.ndarray(
+                    array.shape, dtype=array.dtype, buffer=blocks[key].buf
+                )
+                if key in ("offsets", "targets", "weights"):
+                    shared[...] = array
+
+                arrays[key] = shared
+                del shared
+                specs[key] = (blocks[key].name, array.shape, array.dtype.str)
+
+            # Pasangan (baris, sumber) dibangun sekali lalu dipotong per chunk, O(S) secara total
+            rows: List[Tuple[int, int]] = list(enumerate(source_ids))
+            chunks: List[List[Tuple[int, int]]] = [
+                rows[start : start + chunk_size]
+                for start in range(0, len(rows), chunk_size)
+            ]
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_attach_shared_arrays,
+                initargs=(specs,),
+            ) as executor:
+                for _ in executor.map(_distance_matrix_rows, chunks):
+                    pass
+
+            # Salin hasil keluar dari shared memory sebelum blok dilepas
+            distances = arrays["distances"].copy()
+            predecessors = arrays["predecessors"].copy()
+
+        finally:
+            arrays.clear()
+            for block in blocks.values():
+                block.close()
+                block.unlink()
+
+        return distances, predecessors
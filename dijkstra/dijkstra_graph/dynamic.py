@@ -0,0 +1,151 @@
+import heapq
+from typing import Dict, List, Tuple
+
+from .graph import Dijkstra_Graph
+
+
+# Kelas untuk menyimpan pohon jalur terpendek dari satu vertex sumber dan memperbaikinya secara inkremental
+# Saat bobot edge berubah, hanya vertex yang terdampak (subpohon) yang dihitung ulang, bukan seluruh graf
+class Dynamic_Shortest_Path_Tree:
+    def __init__(self, graph: Dijkstra_Graph, source: str) -> None:
+        if source not in graph.vertices:
+            raise ValueError(f"Vertex '{source}' tidak ada di dalam graf")
+
+        self.graph: Dijkstra_Graph = graph
+        self.source: str = source
+
+        # Jumlah vertex yang labelnya disentuh pada pembaruan terakhir
+        self.repaired_count: int = 0
+
+        self.rebuild()
+
+    # Fungsi untuk menghitung ulang seluruh pohon dari awal
+    def rebuild(self) -> None:
+        self.distances: Dict[str, float] = {
+            vertex: float("inf") for vertex in self.graph.vertices
+        }
+        self.previous_vertices: Dict[str, str | None] = {
+            vertex: None for vertex in self.graph.vertices
+        }
+        self.children: Dict[str, set[str]] = {
+            vertex: set() for vertex in self.graph.vertices
+        }
+
+        self.distances[self.source] = 0
+        self._propagate([(0, self.source)])
+
+        self.repaired_count = len(self.graph.vertices)
+        self.version: int = self.graph.version
+
+    # Fungsi untuk mengganti vertex sebelumnya (parent) dari sebuah vertex di pohon
+    def _set_parent(self, vertex: str, parent: str | None) -> None:
+        previous_vertex: str | None = self.previous_vertices[vertex]
+        if previous_vertex is not None:
+            self.children[previous_vertex].discard(vertex)
+
+        self.previous_vertices[vertex] = parent
+        if parent is not None:
+            self.children[parent].add(vertex)
+
+    # Fungsi untuk menyebarkan perbaikan jarak dari vertex-vertex di heap (Dijkstra terbatas)
+    def _propagate(self, heap: List[Tuple[float, str]]) -> int:
+        heapq.heapify(heap)
+
+        touched: set[str] = set()
+        while heap:
+            distance, current_vertex = heapq.heappop(heap)
+
+            # Lewati entri usang
+            if distance > self.distances[current_vertex]:
+                continue
+
+            touched.add(current_vertex)
+            for neighbor, weight in self.graph.vertices[current_vertex][
+                "edges"
+            ].items():
+                new_distance: float = distance + weight
+                if new_distance < self.distances[neighbor]:
+                    self.distances[neighbor] = new_distance
+                    self._set_parent(neighbor, current_vertex)
+                    heapq.heappush(heap, (new_distance, neighbor))
+
+        return len(touched)
+
+    # Fungsi untuk mengubah bobot edge melalui add_edge dan memperbaiki pohon yang terdampak
+    def update_edge(self, from_vertex: str, to_vertex: str, weight: float) -> None:
+        # Perubahan graf di luar objek ini tidak dapat diperbaiki secara inkremental
+        if self.graph.version != self.version:
+            self.rebuild()
+
+        old_weight: float = (
+            self.graph.vertices[from_vertex]["edges"].get(to_vertex, float("inf"))
+            if from_vertex in self.graph.vertices
+            else float("inf")
+        )
+
+        self.graph.add_edge(from_vertex, to_vertex, weight)
+        if self.graph.version == self.version:
+            return
+
+        self.version = self.graph.version
+        self.repaired_count = 0
+
+        if from_vertex not in self.distances:
+            return
+
+        if weight < old_weight:
+            # Bobot turun: hanya vertex yang jaraknya membaik yang perlu diperbarui
+            new_distance: float = self.distances[from_vertex] + weight
+            if new_distance < self.distances[to_vertex]:
+                self.distances[to_vertex] = new_distance
+                self._set_parent(to_vertex, from_vertex)
+                self.repaired_count = self._propagate([(new_distance, to_vertex)])
+
+        elif weight > old_weight and self.previous_vertices[to_vertex] == from_vertex:
+            # Bobot naik pada edge pohon: kumpulkan subpohon yang bergantung pada edge ini
+            subtree: List[str] = [to_vertex]
+            for vertex in subtree:
+                subtree.extend(self.children[vertex])
+
+            subtree_set: set[str] = set(subtree)
+            for vertex in subtree:
+                self.distances[vertex] = float("inf")
+                self._set_parent(vertex, None)
+
+            # Cari jarak terbaik setiap vertex subpohon dari vertex di luar subpohon
+            heap: List[Tuple[float, str]] = []
+            for vertex in subtree:
+                for previous_vertex, edge_weight in self.graph.vertices[vertex][
+                    "reverse_edges"
+                ].items():
+                    if previous_vertex in subtree_set:
+                        continue
+
+                    new_distance = self.distances[previous_vertex] + edge_weight
+                    if new_distance < self.distances[vertex]:
+                        self.distances[vertex] = new_distance
+                        self._set_parent(vertex, previous_vertex)
+
+                if self.distances[vertex] != float("inf"):
+                    heap.append((self.distances[vertex], vertex))
+
+            self._propagate(heap)
+            self.repaired_count = len(subtree)
+
+    # Fungsi untuk mendapatkan jarak dan jalur terpendek dari sumber ke vertex akhir
+    def shortest_path(self, end_vertex: str) -> Tuple[float, List[str]]:
+        if self.graph.version != self.version:
+            self.rebuild()
+
+        if self.distances[end_vertex] == float("inf"):
+            return float("inf"), []
+
+        path: List[str] = []
+        current_vertex: str | None = end_vertex
+        while current_vertex is not None:
+            path.append(current_vertex)
+            current_vertex = self.previous_vertices[current_vertex]
+
+        path.reverse()
+
+        return self.distances[end_vertex], path
@@ -0,0 +1,899 @@
+import heapq
+import math
+import numpy as np
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Tuple
+
+from .contraction import Contraction_Hierarchy
+from .csr import Dijkstra_CSR_Graph
+from .sharded import Sharded_Dijkstra_Graph
+from .trace import Dijkstra_CSV_Sink, Dijkstra_JSONL_Sink, Dijkstra_Trace
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+
+# Kelas untuk mengimplementasikan algoritma Dijkstra
+class Dijkstra_Graph:
+    def __init__(self, cache_size: int = 128, tree_cache_size: int = 8) -> None:
+        # Inisialisasi dictionary untuk menyimpan vertex dengan informasi di dalamnya (edges, reverse_edges, position_x, position_y)
+        self.vertices: Dict[str, Dict[str, int | Dict[str, float]]] = {}
+
+        # Representasi CSR (Dijkstra_CSR_Graph) yang dibangun ulang setelah graf berubah
+        self._csr: "Dijkstra_CSR_Graph | None" = None
+
+        # Jumlah vertex yang dikunjungi (settled) pada pencarian terakhir
+        self.settled_count: int = 0
+
+        # Skala koordinat ke bobot untuk heuristik A* yang dihitung ulang setelah graf berubah
+        self._coordinate_scale: float | None = None
+
+        # Versi graf yang bertambah setiap kali vertex atau edge ditambahkan
+        self.version: int = 0
+
+        # Cache LRU hasil query (vertex awal, vertex akhir) dan pohon jalur terpendek per vertex awal
+        # Setiap entri menyimpan versi graf saat dihitung agar entri usang dapat dikenali
+        # Pohon berukuran O(V) per entri, sehingga batasnya (tree_cache_size) dibuat jauh lebih kecil
+        self.cache_size: int = cache_size
+        self.tree_cache_size: int = tree_cache_size
+        self._path_cache: OrderedDict = OrderedDict()
+        self._tree_cache: OrderedDict = OrderedDict()
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+
+    # Fungsi untuk menambahkan vertex ke dalam graf
+    def add_vertex(self, vertex: str, position_x: int, position_y: int) -> None:
+        if vertex not in self.vertices:
+            self.vertices[vertex] = {
+                "edges": {},  # Tetangga / neighbours (edges)
+                "reverse_edges": {},  # Vertex asal dari edge yang menuju vertex ini
+                "position_x": position_x,  # Posisi X untuk visualisasi
+                "position_y": position_y,  # Posisi Y untuk visualisasi
+            }
+
+            self.version += 1
+            self._csr = None
+            self._coordinate_scale = None
+
+    # Fungsi untuk menambahkan edge dengan bobot tertentu ke graf
+    def add_edge(self, from_vertex: str, to_vertex: str, weight: float) -> None:
+        if from_vertex not in self.vertices or to_vertex not in self.vertices:
+            return
+
+        # Tambahkan tetangga dan bobot ke vertex asal
+        self.vertices[from_vertex]["edges"][to_vertex] = weight
+
+        # Simpan juga arah sebaliknya untuk pencarian mundur
+        self.vertices[to_vertex]["reverse_edges"][from_vertex] = weight
+
+        self.version += 1
+        self._csr = None
+        self._coordinate_scale = None
+
+    # Fungsi untuk mendapatkan representasi CSR yang dibekukan dari graf
+    def to_csr(self) -> "Dijkstra_CSR_Graph":
+        if self._csr is None:
+            self._csr = Dijkstra_CSR_Graph.from_graph(self)
+
+        return self._csr
+
+    # Fungsi untuk mencari k rute alternatif terpendek (lihat Dijkstra_CSR_Graph.k_shortest_paths)
+    def k_shortest_paths(
+        self, start_vertex: str, end_vertex: str, k: int
+    ) -> List[Tuple[float, List[str]]]:
+        return self.to_csr().k_shortest_paths(start_vertex, end_vertex, k)
+
+    # Fungsi praproses opsional untuk membangun contraction hierarchy dari graf saat ini
+    def build_contraction_hierarchy(
+        self, max_settled: int = 500
+    ) -> "Contraction_Hierarchy":
+        return Contraction_Hierarchy.build(self.to_csr(), max_settled)
+
+    # Fungsi untuk membagi graf ke beberapa shard yang masing-masing berjalan di proses sendiri
+    # method "coordinate" membagi berdasarkan position_x/position_y, method "edge_cut" berdasarkan urutan BFS
+    # Layanan perlu ditutup dengan close() (atau dipakai dengan with) setelah selesai
+    def sharded(
+        self, shard_count: int = 2, method: str = "coordinate"
+    ) -> Sharded_Dijkstra_Graph:
+        return Sharded_Dijkstra_Graph(self.to_csr(), shard_count, method)
+
+    # Fungsi untuk menghitung matriks jarak dari banyak sumber (lihat Dijkstra_CSR_Graph.distance_matrix)
+    def distance_matrix(
+        self,
+        sources: List[str],
+        workers: int | None = None,
+        chunk_size: int | None = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        return self.to_csr().distance_matrix(sources, workers, chunk_size)
+
+    # Fungsi untuk mencari jalur terpendek dengan cache LRU berdasarkan (vertex awal, vertex akhir)
+    # Pohon jalur terpendek per vertex awal ikut disimpan, sehingga query berikutnya dari vertex awal
+    # yang sama cukup menyusun jalur dari pohon (O(panjang jalur)); entri dari versi graf lama diabaikan
+    def cached_shortest_path(
+        self, start_vertex: str, end_vertex: str
+    ) -> Tuple[float, List[str]]:
+        key: Tuple[str, str] = (start_vertex, end_vertex)
+
+        cached = self._path_cache.get(key)
+        if cached is not None and cached[0] == self.version:
+            self._path_cache.move_to_end(key)
+            self.cache_hits += 1
+
+            # Jalur disimpan sebagai tuple, kembalikan list baru agar perubahan oleh pemanggil tidak merusak cache
+            return cached[1], list(cached[2])
+
+        self.cache_misses += 1
+
+        csr: Dijkstra_CSR_Graph = self.to_csr()
+        tree = self._tree_cache.get(start_vertex)
+        if tree is not None and tree[0] == self.version:
+            self._tree_cache.move_to_end(start_vertex)
+
+        else:
+            # Hitung pohon jalur terpendek lengkap dari vertex awal
+            # Disimpan sebagai array NumPy (8 byte per elemen) agar lebih hemat daripada list objek Python
+            distances, previous_vertices = csr.shortest_path_ids(
+                csr.vertex_id(start_vertex)
+            )
+            tree = (
+                self.version,
+                np.asarray(distances, dtype=np.float64),
+                np.asarray(previous_vertices, dtype=np.int64),
+            )
+            self._store_cache(
+                self._tree_cache, start_vertex, tree, self.tree_cache_size
+            )
+
+        _, distances, previous_vertices = tree
+        end_id: int = csr.vertex_id(end_vertex)
+        distance: float = distances[end_id].item()
+        path: Tuple[str, ...] = (
+            tuple(csr.build_path(previous_vertices, end_id))
+            if distance != float("inf")
+            else ()
+        )
+
+        self._store_cache(
+            self._path_cache, key, (self.version, distance, path), self.cache_size
+        )
+
+        return distance, list(path)
+
+    # Fungsi untuk menyimpan entri ke cache dan membuang entri yang paling lama tidak dipakai
+    def _store_cache(self, cache: OrderedDict, key, value, limit: int) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+    # Fungsi untuk mengosongkan seluruh cache jalur terpendek
+    def clear_cache(self) -> None:
+        self._path_cache.clear()
+        self._tree_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    # Fungsi untuk mencari jalur terpendek tanpa mencetak tabel langkah (headless)
+    # Mode solver "heap" memakai binary heap (O((V + E) log V)), mode "list" memakai pencarian linear (O(V²))
+    # Mode solver "csr" menjalankan representasi CSR dengan id integer (bucket Dial otomatis untuk bobot integer),
+    # mode "vectorized" dan "dial" memaksa solver CSR tertentu (lihat Dijkstra_CSR_Graph.shortest_path_ids)
+    # Jika trace (Dijkstra_Trace atau sink JSONL/CSV) diberikan, setiap event langkah diteruskan ke trace
+    # Jika stop_at_end bernilai True, pencarian berhenti begitu vertex akhir dikunjungi
+    def shortest_path(
+        self,
+        start_vertex: str,
+        end_vertex: str,
+        solver: str = "heap",
+        trace: "Dijkstra_Trace | Dijkstra_JSONL_Sink | Dijkstra_CSV_Sink | None" = None,
+        stop_at_end: bool = False,
+    ) -> Tuple[float, List[str]]:
+        if solver not in ("heap", "list", "csr", "vectorized", "dial"):
+            raise ValueError(
+                f"Solver '{solver}' tidak dikenal, "
+                "gunakan 'heap', 'list', 'csr', 'vectorized', atau 'dial'"
+            )
+
+        if solver in ("csr", "vectorized", "dial"):
+            if trace is not None:
+                raise ValueError("Trace hanya didukung oleh solver 'heap' dan 'list'")
+
+            csr: Dijkstra_CSR_Graph = self.to_csr()
+            result = csr.shortest_path(
+                start_vertex,
+                end_vertex,
+                stop_at_end,
+                "auto" if solver == "csr" else solver,
+            )
+            self.settled_count = csr.settled_count
+
+            return result
+
+        distances: Dict[str, float] = {}
+        previous_vertices: Dict[str, None | str] = {}
+
+        if trace is not None:
+            trace.start(list(self.vertices.keys()), start_vertex)
+
+        # Trace selalu diselesaikan (file sink ditutup), termasuk saat pencarian gagal
+        # misalnya karena vertex akhir tidak ada di graf
+        try:
+            # Tanpa trace, generator tidak menghasilkan event sehingga loop di bawah hanya menjalankan pencarian
+            for event in self._dijkstra_steps(
+                start_vertex,
+                end_vertex,
+                solver,
+                stop_at_end,
+                distances,
+                previous_vertices,
+                trace is not None,
+            ):
+                trace.record(event)
+
+        finally:
+            if trace is not None:
+                trace.finish()
+
+        # Jika tidak ada vertex akhir, kembalikan semua jarak
+        if end_vertex is None:
+            return distances
+
+        # Vertex akhir tidak dapat dijangkau dari vertex awal
+        if distances[end_vertex] == float("inf"):
+            return float("inf"), []
+
+        # Rekonstruksi jalur terpendek
+        path: list[str] = []
+        current_vertex = end_vertex
+        while current_vertex is not None:
+            path.append(current_vertex)
+            current_vertex = previous_vertices[current_vertex]
+
+        path.reverse()
+
+        # Kembalikan jarak dan jalur
+        return distances[end_vertex], path
+
+    # Fungsi generator inti Dijkstra (solver "heap" dan "list"), distances dan previous_vertices diisi di tempat
+    # Jika emit_events bernilai True, setiap vertex yang dikunjungi menghasilkan satu event (lihat iter_steps)
+    def _dijkstra_steps(
+        self,
+        start_vertex: str,
+        end_vertex: str | None,
+        solver: str,
+        stop_at_end: bool,
+        distances: Dict[str, float],
+        previous_vertices: Dict[str, None | str],
+        emit_events: bool,
+    ) -> Iterator[Dict]:
+        # Inisialisasi jarak semua vertex ke tak hingga, kecuali vertex awal (0)
+        distances.update({vertex: float("inf") for vertex in self.vertices})
+        distances[start_vertex] = 0
+
+        # Inisialisasi dictionary untuk menyimpan jalur sebelumnya
+        previous_vertices.update({vertex: None for vertex in self.vertices})
+
+        # Daftar vertex yang belum dikunjungi (set pada mode heap agar penghapusan O(1))
+        unvisited: list[str] | set[str] = (
+            set(self.vertices.keys())
+            if solver == "heap"
+            else list(self.vertices.keys())
+        )
+
+        # Urutan vertex dipakai sebagai pemecah seri agar urutan kunjungan mode heap sama dengan mode list
+        order: Dict[str, int] = {
+            vertex: index for index, vertex in enumerate(self.vertices)
+        }
+
+        # Heap berisi (jarak, urutan, vertex), entri usang dilewati saat diambil (lazy decrease-key)
+        heap: List[Tuple[float, int, str]] = [(0, order[start_vertex], start_vertex)]
+
+        self.settled_count = 0
+        while unvisited:
+            # Pilih vertex dengan jarak terkecil yang belum dikunjungi
+            if solver == "heap":
+                while heap and heap[0][2] not in unvisited:
+                    heapq.heappop(heap)
+
+                # Heap kosong berarti sisa vertex tidak dapat dijangkau
+                if not heap:
+                    break
+
+                current_vertex: str = heapq.heappop(heap)[2]
+
+            else:
+                current_vertex: str = min(
+                    unvisited, key=lambda vertex: distances[vertex]
+                )
+
+            # Jika jarak ke vertex saat ini tak hingga, hentikan proses
+            if distances[current_vertex] == float("inf"):
+                break
+
+            self.settled_count += 1
+
+            # Jarak vertex akhir sudah final begitu vertex tersebut dikunjungi
+            if stop_at_end and current_vertex == end_vertex:
+                if emit_events:
+                    yield {
+                        "step": self.settled_count - 1,
+                        "vertex": current_vertex,
+                        "distance": distances[current_vertex],
+                        "relaxed": [],
+                    }
+
+                break
+
+            # Edge yang direlaksasi pada langkah ini (hanya dicatat jika event diminta)
+            relaxed: List[Tuple[str, float, float, bool]] = []
+
+            # Perbarui jarak ke tetangga dari vertex saat ini
+            edges: Dict[str, float] = self.vertices[current_vertex]["edges"]
+            for neighbor, weight in edges.items():
+                new_distance: float = distances[current_vertex] + weight
+
+                # Jika jarak baru lebih kecil, perbarui jarak dan vertex sebelumnya
+                improved: bool = new_distance < distances[neighbor]
+                if improved:
+                    distances[neighbor] = new_distance
+                    previous_vertices[neighbor] = current_vertex
+
+                    if solver == "heap":
+                        heapq.heappush(heap, (new_distance, order[neighbor], neighbor))
+
+                if emit_events:
+                    relaxed.append((neighbor, weight, new_distance, improved))
+
+            if emit_events:
+                yield {
+                    "step": self.settled_count - 1,
+                    "vertex": current_vertex,
+                    "distance": distances[current_vertex],
+                    "relaxed": relaxed,
+                }
+
+            # Hapus vertex saat ini dari daftar yang belum dikunjungi
+            unvisited.remove(current_vertex)
+
+    # Fungsi generator untuk mengalirkan langkah Dijkstra satu per satu tanpa menyimpan tabel
+    # Setiap event berisi nomor langkah ("step"), vertex yang dikunjungi ("vertex"), jaraknya ("distance"),
+    # dan edge yang direlaksasi ("relaxed") berupa (tetangga, bobot, jarak baru, apakah jarak diperbarui)
+    def iter_steps(
+        self,
+        start_vertex: str,
+        end_vertex: str | None = None,
+        solver: str = "heap",
+        stop_at_end: bool = False,
+    ) -> Iterator[Dict]:
+        if solver not in ("heap", "list"):
+            raise ValueError(
+                "Event langkah hanya didukung oleh solver 'heap' dan 'list'"
+            )
+
+        yield from self._dijkstra_steps(
+            start_vertex, end_vertex, solver, stop_at_end, {}, {}, True
+        )
+
+    # Fungsi untuk menjalankan algoritma Dijkstra dan menampilkan hasil langkah-langkah
+    # Jika render_each_step bernilai False, tabel hanya dicetak sekali di akhir
+    # Jika stop_at_end bernilai True, pencarian berhenti begitu vertex akhir dikunjungi
+    def display_dijkstra(
+        self,
+        start_vertex: str,
+        end_vertex: str,
+        solver: str = "heap",
+        render_each_step: bool = True,
+        stop_at_end: bool = False,
+    ) -> Tuple[float, List[str]]:
+        trace: Dijkstra_Trace = Dijkstra_Trace()
+        result = self.shortest_path(
+            start_vertex, end_vertex, solver, trace, stop_at_end
+        )
+
+        if not render_each_step:
+            print(trace.render())
+            print()
+
+        else:
+            # Cetak tabel untuk setiap langkah
+            table: List[List[str]] = trace.rows()
+            for index, step in enumerate(trace.steps):
+                print(
+                    f"Langkah {step['step']} - Vertex yang Sedang Dikunjungi: {step['vertex']}"
+                )
+                print(trace.format_table(table[: index + 1]))
+                print()
+
+        if stop_at_end:
+            print(
+                f"Jumlah vertex yang dikunjungi: {self.settled_count} dari {len(self.vertices)}"
+            )
+            print()
+
+        return result
+
+    # Fungsi untuk mencari jalur terpendek dengan Dijkstra dua arah (maju dari vertex awal, mundur dari vertex akhir)
+    # Pencarian berhenti saat jumlah kunci teratas kedua heap >= jarak terbaik yang sudah ditemukan
+    def bidirectional_dijkstra(
+        self, start_vertex: str, end_vertex: str
+    ) -> Tuple[float, List[str]]:
+        for vertex in (start_vertex, end_vertex):
+            if vertex not in self.vertices:
+                raise ValueError(f"Vertex '{vertex}' tidak ada di dalam graf")
+
+        self.settled_count = 0
+        if start_vertex == end_vertex:
+            return 0, [start_vertex]
+
+        # Index 0 untuk pencarian maju (edges), index 1 untuk pencarian mundur (reverse_edges)
+        adjacency_keys: Tuple[str, str] = ("edges", "reverse_edges")
+        distances: Tuple[Dict[str, float], Dict[str, float]] = (
+            {start_vertex: 0},
+            {end_vertex: 0},
+        )
+        previous_vertices: Tuple[Dict[str, str], Dict[str, str]] = ({}, {})
+        settled: Tuple[set[str], set[str]] = (set(), set())
+        heaps: Tuple[List[Tuple[float, str]], List[Tuple[float, str]]] = (
+            [(0, start_vertex)],
+            [(0, end_vertex)],
+        )
+
+        # Jarak terbaik yang ditemukan sejauh ini dan vertex pertemuannya
+        best_distance: float = float("inf")
+        meeting_vertex: str | None = None
+
+        while heaps[0] and heaps[1]:
+            # Kondisi berhenti: tidak ada jalur yang lebih pendek dari best_distance
+            if heaps[0][0][0] + heaps[1][0][0] >= best_distance:
+                break
+
+            # Kembangkan sisi dengan kunci teratas yang lebih kecil
+            side: int = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            other: int = 1 - side
+
+            distance, current_vertex = heapq.heappop(heaps[side])
+            if current_vertex in settled[side]:
+                continue
+
+            settled[side].add(current_vertex)
+            self.settled_count += 1
+
+            edges: Dict[str, float] = self.vertices[current_vertex][
+                adjacency_keys[side]
+            ]
+            for neighbor, weight in edges.items():
+                new_distance: float = distance + weight
+                if new_distance < distances[side].get(neighbor, float("inf")):
+                    distances[side][neighbor] = new_distance
+                    previous_vertices[side][neighbor] = current_vertex
+                    heapq.heappush(heaps[side], (new_distance, neighbor))
+
+                    # Perbarui jarak terbaik jika vertex ini sudah dicapai oleh sisi lainnya
+                    if neighbor in distances[other]:
+                        total: float = new_distance + distances[other][neighbor]
+                        if total < best_distance:
+                            best_distance = total
+                            meeting_vertex = neighbor
+
+        if meeting_vertex is None:
+            return float("inf"), []
+
+        # Gabungkan jalur maju (awal -> pertemuan) dan jalur mundur (pertemuan -> akhir)
+        path: List[str] = []
+        current_vertex: str | None = meeting_vertex
+        while current_vertex is not None:
+            path.append(current_vertex)
+            current_vertex = previous_vertices[0].get(current_vertex)
+
+        path.reverse()
+
+        current_vertex = previous_vertices[1].get(meeting_vertex)
+        while current_vertex is not None:
+            path.append(current_vertex)
+            current_vertex = previous_vertices[1].get(current_vertex)
+
+        return best_distance, path
+
+    # Fungsi untuk menghitung skala terbesar yang aman antara jarak Euclidean koordinat dan bobot edge
+    # Heuristik skala * jarak Euclidean admissible (dan konsisten) jika setiap bobot edge >= skala * panjang Euclidean edge
+    def coordinate_scale(self) -> float:
+        if self._coordinate_scale is not None:
+            return self._coordinate_scale
+
+        scale: float = float("inf")
+        for vertex, data in self.vertices.items():
+            for neighbor, weight in data["edges"].items():
+                length: float = math.hypot(
+                    self.vertices[neighbor]["position_x"] - data["position_x"],
+                    self.vertices[neighbor]["position_y"] - data["position_y"],
+                )
+
+                if length > 0:
+                    scale = min(scale, weight / length)
+
+        # Tanpa edge yang memiliki panjang, heuristik koordinat tidak memberi informasi
+        self._coordinate_scale = 0.0 if scale == float("inf") else scale
+
+        return self._coordinate_scale
+
+    # Fungsi untuk mencari jalur terpendek dengan A* menggunakan koordinat vertex sebagai heuristik
+    # heuristic(vertex, end_vertex) dapat diberikan sendiri, jika tidak dipakai skala * jarak Euclidean
+    # weight_scale yang dideklarasikan diverifikasi terhadap coordinate_scale() agar heuristik tetap admissible
+    def a_star(
+        self,
+        start_vertex: str,
+        end_vertex: str,
+        heuristic: Callable[[str, str], float] | None = None,
+        weight_scale: float | None = None,
+    ) -> Tuple[float, List[str]]:
+        for vertex in (start_vertex, end_vertex):
+            if vertex not in self.vertices:
+                raise ValueError(f"Vertex '{vertex}' tidak ada di dalam graf")
+
+        if heuristic is None:
+            maximum_scale: float = self.coordinate_scale()
+            if weight_scale is None:
+                weight_scale = maximum_scale
+
+            elif weight_scale > maximum_scale * (1 + 1e-9):
+                raise ValueError(
+                    f"weight_scale {weight_scale} tidak admissible, "
+                    f"skala maksimal untuk graf ini adalah {maximum_scale}"
+                )
+
+            end_x: float = self.vertices[end_vertex]["position_x"]
+            end_y: float = self.vertices[end_vertex]["position_y"]
+
+            def heuristic(vertex: str, _: str) -> float:
+                return weight_scale * math.hypot(
+                    self.vertices[vertex]["position_x"] - end_x,
+                    self.vertices[vertex]["position_y"] - end_y,
+                )
+
+        distances: Dict[str, float] = {start_vertex: 0}
+        previous_vertices: Dict[str, str] = {}
+        settled: set[str] = set()
+
+        # Heap berisi (jarak + heuristik, vertex)
+        heap: List[Tuple[float, str]] = [
+            (heuristic(start_vertex, end_vertex), start_vertex)
+        ]
+
+        self.settled_count = 0
+        while heap:
+            _, current_vertex = heapq.heappop(heap)
+            if current_vertex in settled:
+                continue
+
+            settled.add(current_vertex)
+            self.settled_count += 1
+
+            if current_vertex == end_vertex:
+                break
+
+            for neighbor, weight in self.vertices[current_vertex]["edges"].items():
+                new_distance: float = distances[current_vertex] + weight
+                if new_distance < distances.get(neighbor, float("inf")):
+                    distances[neighbor] = new_distance
+                    previous_vertices[neighbor] = current_vertex
+                    heapq.heappush(
+                        heap,
+                        (new_distance + heuristic(neighbor, end_vertex), neighbor),
+                    )
+
+        if end_vertex not in settled:
+            return float("inf"), []
+
+        path: List[str] = []
+        current_vertex: str | None = end_vertex
+        while current_vertex is not None:
+            path.append(current_vertex)
+            current_vertex = previous_vertices.get(current_vertex)
+
+        path.reverse()
+
+        return distances[end_vertex], path
+
+    # Fungsi untuk memvisualisasikan graf sebelum dan sesudah algoritma Dijkstra
+    # renderer "networkx" menggambar seperti semula, renderer "fast" memakai LineCollection untuk graf besar
+    # Jika file_path diisi, gambar disimpan ke file (PNG/SVG sesuai ekstensi) tanpa memanggil plt.show()
+    def visualize_graph(
+        self,
+        start_vertex: str,
+        end_vertex: str,
+        path: List[str],
+        renderer: str = "networkx",
+        file_path: str | None = None,
+        max_labels: int = 200,
+    ) -> None:
+        if renderer == "fast":
+            self._visualize_graph_fast(
+                start_vertex, end_vertex, path, file_path, max_labels
+            )
+            return
+
+        if renderer != "networkx":
+            raise ValueError(f"Renderer '{renderer}' tidak dikenal")
+
+        # networkx dan matplotlib di-import saat pertama dipakai agar import solver tetap ringan
+        import networkx as nx
+        from matplotlib import pyplot as plt
+
+        G: nx.DiGraph = nx.DiGraph()  # Inisialisasi graf berarah
+
+        # Tambahkan semua vertex dan edge ke graf NetworkX
+        for vertex in self.vertices.keys():
+            for edge in self.vertices[vertex]["edges"].keys():
+                G.add_edge(vertex, edge, weight=self.vertices[vertex]["edges"][edge])
+
+        plt.figure(figsize=(15, 5))
+
+        # Tentukan posisi vertex untuk visualisasi
+        position: Dict[str, Tuple[int, int]] = {}
+        for vertex in self.vertices:
+            position[vertex] = (
+                self.vertices[vertex]["position_x"],
+                self.vertices[vertex]["position_y"],
+            )
+
+        # Layout graf untuk visualisasi
+        layout = position or nx.spring_layout(G, seed=42)
+        label_edge = nx.get_edge_attributes(G, "weight")
+
+        # Warna node berdasarkan statusnya
+        node_color: List[str] = []
+        for node in G.nodes:
+            if node == start_vertex:
+                node_color.append("yellow")
+
+            elif node == end_vertex:
+                node_color.append("red")
+
+            else:
+                node_color.append("lightblue")
+
+        # Subplot pertama: graf sebelum algoritma Dijkstra
+        plt.subplot(121)
+        plt.title("Proses Sebelum Dijkstra")
+        nx.draw(
+            G,
+            pos=layout,
+            with_labels=True,
+            node_color=node_color,
+            node_size=2000,
+            font_size=9,
+            font_weight="bold",
+            edge_color="gray",
+            width=2,
+        )
+        nx.draw_networkx_edge_labels(
+            G, pos=layout, edge_labels=label_edge, font_size=10
+        )
+
+        # Tentukan edge yang termasuk dalam jalur terpendek
+        edge_list: List[Tuple[str, str]] = list(zip(path, path[1:]))
+
+        # Subplot kedua: graf setelah algoritma Dijkstra
+        plt.subplot(122)
+        plt.title("Proses Setelah Dijkstra")
+        nx.draw(
+            G,
+            pos=layout,
+            with_labels=True,
+            node_color=node_color,
+            node_size=2000,
+            font_size=9,
+            font_weight="bold",
+            edge_color="gray",
+            width=2,
+        )
+        nx.draw_networkx_edges(
+            G, pos=layout, edgelist=edge_list, edge_color="red", width=3
+        )
+        nx.draw_networkx_nodes(
+            G, pos=layout, nodelist=[end_vertex], node_color="red", node_size=2000
+        )
+        nx.draw_networkx_edge_labels(
+            G, pos=layout, edge_labels=label_edge, font_size=10
+        )
+
+        plt.tight_layout()
+        self._show_figure(plt.gcf(), file_path)
+
+    # Fungsi untuk menampilkan gambar, atau menyimpannya ke file jika file_path diisi (untuk mode headless)
+    def _show_figure(self, figure: "Figure", file_path: str | None) -> None:
+        from matplotlib import pyplot as plt
+
+        if file_path is None:
+            plt.show()
+            return
+
+        figure.savefig(file_path)
+        plt.close(figure)
+
+    # Fungsi untuk menggambar edge berarah pada render cepat, segments berbentuk (edge, 2, 2)
+    # Jika arrows bernilai True (graf kecil), setiap edge digambar sebagai panah yang berhenti di tepi node,
+    # selain itu edge tetap satu LineCollection dan arahnya ditunjukkan oleh kepala panah kecil di tengah edge (satu quiver)
+    def _draw_fast_edges(
+        self,
+        axis: "Axes",
+        segments: np.ndarray,
+        color: str,
+        width: float,
+        zorder: int,
+        node_size: float,
+        arrows: bool,
+    ) -> None:
+        from matplotlib.collections import LineCollection
+
+        if arrows:
+            # Ukuran scatter adalah luas marker dalam point², jari-jari node = akar luas / 2
+            node_radius: float = math.sqrt(node_size) / 2
+            for source, target in segments:
+                axis.annotate(
+                    "",
+                    xy=target,
+                    xytext=source,
+                    arrowprops=dict(
+                        arrowstyle="-|>",
+                        color=color,
+                        linewidth=width,
+                        mutation_scale=15,
+                        shrinkA=node_radius,
+                        shrinkB=node_radius,
+                    ),
+                    zorder=zorder,
+                )
+
+            # Garis tidak terlihat agar batas sumbu tetap mencakup seluruh edge
+            axis.add_collection(
+                LineCollection(segments, colors=color, linewidths=0, zorder=zorder)
+            )
+            return
+
+        axis.add_collection(
+            LineCollection(segments, colors=color, linewidths=width, zorder=zorder)
+        )
+
+        directions: np.ndarray = segments[:, 1] - segments[:, 0]
+        lengths: np.ndarray = np.linalg.norm(directions, axis=1)
+        visible: np.ndarray = lengths > 0
+        if not np.any(visible):
+            return
+
+        middles: np.ndarray = segments[visible].mean(axis=1)
+        directions = directions[visible] / lengths[visible, None]
+        axis.quiver(
+            middles[:, 0],
+            middles[:, 1],
+            directions[:, 0],
+            directions[:, 1],
+            color=color,
+            angles="xy",
+            pivot="mid",
+            scale_units="inches",
+            scale=8,
+            width=0.004,
+            headwidth=4,
+            headlength=5,
+            headaxislength=4.5,
+            zorder=zorder,
+        )
+
+    # Fungsi render cepat: semua edge digambar sebagai satu LineCollection dan semua vertex sebagai satu scatter
+    # Label vertex dan bobot edge hanya digambar jika jumlahnya tidak melebihi max_labels,
+    # selain itu hanya vertex awal/akhir dan edge pada jalur yang diberi label
+    def _visualize_graph_fast(
+        self,
+        start_vertex: str,
+        end_vertex: str,
+        path: List[str],
+        file_path: str | None,
+        max_labels: int,
+    ) -> None:
+        from matplotlib import pyplot as plt
+
+        csr: Dijkstra_CSR_Graph = self.to_csr()
+        positions: np.ndarray = np.column_stack((csr.position_x, csr.position_y))
+        sources: np.ndarray = np.repeat(
+            np.arange(csr.vertex_count), np.diff(csr.offsets)
+        )
+
+        # Segmen garis setiap edge dengan bentuk (edge, 2, 2)
+        segments: np.ndarray = np.stack(
+            (positions[sources], positions[csr.targets]), axis=1
+        )
+
+        # Warna node berdasarkan statusnya
+        node_color: np.ndarray = np.full(csr.vertex_count, "lightblue", dtype=object)
+        node_color[csr.vertex_id(start_vertex)] = "yellow"
+        node_color[csr.vertex_id(end_vertex)] = "red"
+
+        # Ukuran node mengecil seiring banyaknya vertex agar gambar tetap terbaca
+        node_size: float = min(2000.0, max(1.0, 50000.0 / max(csr.vertex_count, 1)))
+
+        path_ids: np.ndarray = np.array(
+            [csr.vertex_id(vertex) for vertex in path], dtype=np.int64
+        )
+        path_segments: np.ndarray = np.stack(
+            (positions[path_ids[:-1]], positions[path_ids[1:]]), axis=1
+        )
+
+        # Label yang akan digambar setelah culling
+        if csr.vertex_count <= max_labels:
+            label_vertices: np.ndarray = np.arange(csr.vertex_count)
+        else:
+            label_vertices = np.unique(
+                [csr.vertex_id(start_vertex), csr.vertex_id(end_vertex)]
+            )
+
+        if csr.edge_count <= max_labels:
+            label_edges: List[Tuple[int, int, float]] = list(
+                zip(sources.tolist(), csr.targets.tolist(), csr.weights.tolist())
+            )
+        elif len(path) - 1 <= max_labels:
+            label_edges = [
+                (u, w, csr.edge_weight(u, w))
+                for u, w in zip(path_ids[:-1].tolist(), path_ids[1:].tolist())
+            ]
+        else:
+            label_edges = []
+
+        figure, axes = plt.subplots(1, 2, figsize=(15, 5))
+        for axis, title in zip(
+            axes, ("Proses Sebelum Dijkstra", "Proses Setelah Dijkstra")
+        ):
+            axis.set_title(title)
+            self._draw_fast_edges(
+                axis, segments, "gray", 1, 1, node_size, csr.edge_count <= max_labels
+            )
+
+            # Subplot kedua: jalur terpendek ditandai merah
+            if axis is axes[1] and len(path_segments) > 0:
+                self._draw_fast_edges(
+                    axis,
+                    path_segments,
+                    "red",
+                    3,
+                    2,
+                    node_size,
+                    csr.edge_count <= max_labels,
+                )
+
+            axis.scatter(
+                positions[:, 0],
+                positions[:, 1],
+                s=node_size,
+                c=node_color.tolist(),
+                zorder=3,
+            )
+
+            for vertex in label_vertices.tolist():
+                axis.annotate(
+                    csr.vertex_name(vertex),
+                    positions[vertex],
+                    ha="center",
+                    va="center",
+                    fontsize=9,
+                    fontweight="bold",
+                    zorder=4,
+                )
+
+            for u, w, weight in label_edges:
+                axis.annotate(
+                    f"{weight:g}",
+                    (positions[u] + positions[w]) / 2,
+                    ha="center",
+                    va="center",
+                    fontsize=10,
+                    zorder=4,
+                )
+
+            # Margin agar node besar di tepi gambar tidak terpotong, autoscale tidak memperhitungkan ukuran marker
+            axis.margins(0.1)
+            axis.autoscale_view()
+            axis.set_axis_off()
+
+        figure.tight_layout()
+        self._show_figure(figure, file_path)
@@ -0,0 +1,405 @@
+import heapq
+import numpy as np
+import queue
+from collections import deque
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from .csr import Dijkstra_CSR_Graph
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess as Process
+    from multiprocessing.queues import Queue
+
+
+# Fungsi partisi berdasarkan koordinat (recursive coordinate bisection)
+# Vertex dibelah pada median sumbu dengan rentang terlebar sampai jumlah shard tercapai, ukuran shard seimbang
+def _partition_coordinates(
+    position_x: np.ndarray, position_y: np.ndarray, shard_count: int
+) -> np.ndarray:
+    shard_of: np.ndarray = np.zeros(len(position_x), dtype=np.int32)
+
+    stack: List[Tuple[np.ndarray, int, int]] = [
+        (np.arange(len(position_x)), 0, shard_count)
+    ]
+    while stack:
+        vertices, first_shard, count = stack.pop()
+        if count == 1 or len(vertices) == 0:
+            shard_of[vertices] = first_shard
+            continue
+
+        xs: np.ndarray = position_x[vertices]
+        ys: np.ndarray = position_y[vertices]
+        axis: np.ndarray = xs if np.ptp(xs) >= np.ptp(ys) else ys
+        order: np.ndarray = vertices[np.argsort(axis, kind="stable")]
+
+        # Jumlah vertex di setiap sisi sebanding dengan jumlah shard di sisi tersebut
+        left_count: int = count // 2
+        split: int = len(vertices) * left_count // count
+        stack.append((order[:split], first_shard, left_count))
+        stack.append((order[split:], first_shard + left_count, count - left_count))
+
+    return shard_of
+
+
+# Fungsi partisi dengan heuristik edge-cut sederhana: vertex diurutkan dengan BFS (mengabaikan arah edge),
+# lalu urutan tersebut dipotong menjadi shard berukuran sama, sehingga tetangga cenderung berada di shard yang sama
+def _partition_edge_cut(graph: Dijkstra_CSR_Graph, shard_count: int) -> np.ndarray:
+    reverse: Dijkstra_CSR_Graph = graph.reverse()
+    offsets: List[int] = graph.offsets.tolist()
+    targets: List[int] = graph.targets.tolist()
+    reverse_offsets: List[int] = reverse.offsets.tolist()
+    reverse_targets: List[int] = reverse.targets.tolist()
+
+    visited: List[bool] = [False] * graph.vertex_count
+    order: List[int] = []
+    for root in range(graph.vertex_count):
+        if visited[root]:
+            continue
+
+        visited[root] = True
+        queue: deque[int] = deque([root])
+        while queue:
+            vertex: int = queue.popleft()
+            order.append(vertex)
+
+            for neighbor in (
+                targets[offsets[vertex] : offsets[vertex + 1]]
+                + reverse_targets[reverse_offsets[vertex] : reverse_offsets[vertex + 1]]
+            ):
+                if not visited[neighbor]:
+                    visited[neighbor] = True
+                    queue.append(neighbor)
+
+    shard_of: np.ndarray = np.empty(graph.vertex_count, dtype=np.int32)
+    shard_of[order] = (
+        np.arange(graph.vertex_count, dtype=np.int64)
+        * shard_count
+        // max(graph.vertex_count, 1)
+    )
+
+    return shard_of
+
+
+# Fungsi utama proses worker shard: menyimpan edge keluar dari vertex milik shard ini saja
+# Pesan dari koordinator:
+# - ("relax", query, seeds, bound, target): Dijkstra multi-sumber dari seeds (vertex, jarak, vertex sebelumnya),
+#   dibalas dengan kandidat jarak untuk vertex di shard lain, jarak target (jika milik shard ini), dan jumlah kunjungan
+# - ("path", query, vertex): telusuri vertex sebelumnya di shard ini, dibalas dengan potongan jalur dan vertex
+#   lanjutannya
+# - None: hentikan worker
+# Setiap balasan berbentuk (jenis, query, shard, ...) agar koordinator dapat membuang balasan dari query lama
+def _shard_worker(
+    shard: int,
+    vertex_ids: np.ndarray,
+    offsets: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+    inbox: "Queue",
+    outbox: "Queue",
+) -> None:
+    global_ids: List[int] = vertex_ids.tolist()
+    local: Dict[int, int] = {vertex: index for index, vertex in enumerate(global_ids)}
+    offsets_list: List[int] = offsets.tolist()
+    targets_list: List[int] = targets.tolist()
+    weights_list: List[float] = weights.tolist()
+
+    # Status query yang sedang berjalan, disimpan antar ronde agar hanya perbaikan jarak yang diproses ulang
+    query: int = -1
+    distances: List[float] = []
+    previous_vertices: List[int] = []
+
+    while True:
+        message = inbox.get()
+        if message is None:
+            break
+
+        # Id query pesan ini, ikut dikirim pada setiap balasan termasuk balasan error
+        message_query: int = message[1]
+
+        try:
+            if message[0] == "relax":
+                _, query_id, seeds, bound, target = message
+                if query_id != query:
+                    query = query_id
+                    distances = [float("inf")] * len(global_ids)
+                    previous_vertices = [-1] * len(global_ids)
+
+                heap: List[Tuple[float, int]] = []
+                for vertex, distance, previous_vertex in seeds:
+                    index: int = local[vertex]
+                    if distance < distances[index]:
+                        distances[index] = distance
+                        previous_vertices[index] = previous_vertex
+                        heapq.heappush(heap, (distance, index))
+
+                # Kandidat jarak terbaik untuk vertex di shard lain: vertex -> (jarak, vertex sebelumnya)
+                outgoing: Dict[int, Tuple[float, int]] = {}
+                settled_count: int = 0
+                while heap:
+                    distance, index = heapq.heappop(heap)
+                    if distance > distances[index]:
+                        continue
+
+                    # Vertex dengan jarak >= jarak target yang sudah diketahui tidak dapat memperpendek jalur
+                    if distance >= bound:
+                        break
+
+                    settled_count += 1
+                    current_vertex: int = global_ids[index]
+                    if current_vertex == target:
+                        bound = distance
+                        continue
+
+                    for edge in range(offsets_list[index], offsets_list[index + 1]):
+                        neighbor: int = targets_list[edge]
+                        new_distance: float = distance + weights_list[edge]
+                        if new_distance >= bound:
+                            continue
+
+                        neighbor_index: int | None = local.get(neighbor)
+                        if neighbor_index is None:
+                            if new_distance < outgoing.get(neighbor, (bound,))[0]:
+                                outgoing[neighbor] = (new_distance, current_vertex)
+
+                        elif new_distance < distances[neighbor_index]:
+                            distances[neighbor_index] = new_distance
+                            previous_vertices[neighbor_index] = current_vertex
+                            heapq.heappush(heap, (new_distance, neighbor_index))
+
+                target_index: int | None = local.get(target)
+                outbox.put(
+                    (
+                        "relax",
+                        query,
+                        shard,
+                        [
+                            (vertex, distance, previous_vertex)
+                            for vertex, (distance, previous_vertex) in outgoing.items()
+                        ],
+                        (
+                            distances[target_index]
+                            if target_index is not None
+                            else float("inf")
+                        ),
+                        settled_count,
+                    )
+                )
+
+            elif message[0] == "path":
+                vertex: int = message[2]
+                segment: List[int] = [vertex]
+                previous_vertex: int = previous_vertices[local[vertex]]
+                while previous_vertex in local:
+                    segment.append(previous_vertex)
+                    previous_vertex = previous_vertices[local[previous_vertex]]
+
+                outbox.put(("path", query, shard, segment, previous_vertex))
+
+        except Exception as error:
+            outbox.put(("error", message_query, shard, repr(error)))
+
+
+# Kelas layanan jalur terpendek terpartisi: vertex dibagi ke beberapa shard, setiap shard berjalan di proses sendiri
+# Koordinator menjalankan query dalam ronde: setiap shard menjalankan Dijkstra lokal dari jarak batas (boundary)
+# yang diterimanya, lalu kandidat jarak untuk vertex di shard lain dikirim lewat multiprocessing Queue.
+# Ronde berulang sampai tidak ada jarak yang membaik, sehingga hasilnya tetap tepat (exact) seperti Dijkstra biasa
+class Sharded_Dijkstra_Graph:
+    def __init__(
+        self,
+        graph: Dijkstra_CSR_Graph,
+        shard_count: int = 2,
+        method: str = "coordinate",
+        receive_timeout: float = 1.0,
+    ) -> None:
+        if shard_count < 1:
+            raise ValueError("shard_count minimal bernilai 1")
+
+        if method == "coordinate":
+            shard_of: np.ndarray = _partition_coordinates(
+                graph.position_x, graph.position_y, shard_count
+            )
+
+        elif method == "edge_cut":
+            shard_of = _partition_edge_cut(graph, shard_count)
+
+        else:
+            raise ValueError(
+                f"Metode partisi '{method}' tidak dikenal, gunakan 'coordinate' atau 'edge_cut'"
+            )
+
+        # multiprocessing hanya di-import saat layanan dibuat agar import paket tetap ringan
+        import multiprocessing
+
+        self.names: np.ndarray = graph.names
+        self._index: Dict[str, int] | None = None
+        self.shard_count: int = shard_count
+        self.shard_of: np.ndarray = shard_of  # Shard pemilik setiap vertex
+
+        sources: np.ndarray = np.repeat(
+            np.arange(graph.vertex_count, dtype=np.int32), np.diff(graph.offsets)
+        )
+
+        # Jumlah edge yang menghubungkan dua shard berbeda
+        self.cut_edge_count: int = int(
+            np.count_nonzero(shard_of[sources] != shard_of[graph.targets])
+        )
+
+        self.settled_count: int = 0
+        self.round_count: int = 0
+        self._query: int = 0
+
+        # Selang waktu (detik) menunggu balasan sebelum memeriksa apakah seluruh worker masih hidup
+        self.receive_timeout: float = receive_timeout
+
+        self._outbox: Queue = multiprocessing.Queue()
+        self._inboxes: List[Queue] = []
+        self._processes: List[Process] = []
+        for shard in range(shard_count):
+            vertex_ids: np.ndarray = np.flatnonzero(shard_of == shard)
+            degrees: np.ndarray = np.diff(graph.offsets)[vertex_ids]
+            offsets: np.ndarray = np.zeros(len(vertex_ids) + 1, dtype=np.int64)
+            np.cumsum(degrees, out=offsets[1:])
+
+            # Edge keluar dari vertex milik shard ini, target tetap memakai id global
+            edges: np.ndarray = np.repeat(
+                graph.offsets[vertex_ids] - offsets[:-1], degrees
+            ) + np.arange(offsets[-1])
+
+            inbox: Queue = multiprocessing.Queue()
+            process: Process = multiprocessing.Process(
+                target=_shard_worker,
+                args=(
+                    shard,
+                    vertex_ids,
+                    offsets,
+                    graph.targets[edges],
+                    graph.weights[edges],
+                    inbox,
+                    self._outbox,
+                ),
+                daemon=True,
+            )
+            process.start()
+
+            self._inboxes.append(inbox)
+            self._processes.append(process)
+
+    def __enter__(self) -> "Sharded_Dijkstra_Graph":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+    # Fungsi untuk menghentikan seluruh proses worker shard
+    def close(self) -> None:
+        for inbox in self._inboxes:
+            inbox.put(None)
+
+        for process in self._processes:
+            process.join()
+
+        self._inboxes = []
+        self._processes = []
+
+    # Fungsi untuk mendapatkan id integer dari nama vertex
+    def vertex_id(self, vertex: str) -> int:
+        if self._index is None:
+            self._index = {
+                name: index for index, name in enumerate(self.names.tolist())
+            }
+
+        if vertex not in self._index:
+            raise ValueError(f"Vertex '{vertex}' tidak ada di dalam graf")
+
+        return self._index[vertex]
+
+    # Fungsi untuk menerima sejumlah balasan query yang sedang berjalan dari worker
+    # Balasan dari query lama dibuang, worker yang mati dideteksi lewat timeout agar pemanggil tidak menunggu selamanya,
+    # dan error di worker diteruskan ke pemanggil setelah seluruh balasan ronde ini dibaca
+    def _receive(self, reply_count: int = 1) -> List[Tuple]:
+        replies: List[Tuple] = []
+        while len(replies) < reply_count:
+            try:
+                message: Tuple = self._outbox.get(timeout=self.receive_timeout)
+            except queue.Empty:
+                for shard, process in enumerate(self._processes):
+                    if not process.is_alive():
+                        raise RuntimeError(
+                            f"Worker shard {shard} berhenti (exit code {process.exitcode})"
+                        )
+
+                continue
+
+            if message[1] == self._query:
+                replies.append(message)
+
+        for message in replies:
+            if message[0] == "error":
+                raise RuntimeError(f"Worker shard {message[2]} gagal: {message[3]}")
+
+        return replies
+
+    # Fungsi untuk mencari jalur terpendek lintas shard, mengembalikan (jarak, jalur) seperti Dijkstra_Graph
+    def shortest_path(
+        self, start_vertex: str, end_vertex: str
+    ) -> Tuple[float, List[str]]:
+        if not self._processes:
+            raise ValueError("Layanan shard sudah ditutup")
+
+        source: int = self.vertex_id(start_vertex)
+        target: int = self.vertex_id(end_vertex)
+
+        self._query += 1
+        self.settled_count = 0
+        self.round_count = 0
+
+        # Jarak terbaik untuk vertex batas yang sudah dikirim ke shard pemiliknya
+        boundary: Dict[int, float] = {source: 0}
+        pending: Dict[int, List[Tuple[int, float, int]]] = {
+            int(self.shard_of[source]): [(source, 0, -1)]
+        }
+        bound: float = float("inf")
+        while pending:
+            self.round_count += 1
+            for shard, seeds in pending.items():
+                self._inboxes[shard].put(("relax", self._query, seeds, bound, target))
+
+            replies: List[Tuple] = self._receive(len(pending))
+
+            for _, _, _, _, target_distance, settled_count in replies:
+                bound = min(bound, target_distance)
+                self.settled_count += settled_count
+
+            # Gabungkan kandidat dari seluruh shard, hanya perbaikan jarak yang dikirim pada ronde berikutnya
+            candidates: Dict[int, Tuple[float, int]] = {}
+            for _, _, _, outgoing, _, _ in replies:
+                for vertex, distance, previous_vertex in outgoing:
+                    if (
+                        distance < bound
+                        and distance < boundary.get(vertex, float("inf"))
+                        and distance < candidates.get(vertex, (float("inf"),))[0]
+                    ):
+                        candidates[vertex] = (distance, previous_vertex)
+
+            pending = {}
+            for vertex, (distance, previous_vertex) in candidates.items():
+                boundary[vertex] = distance
+                pending.setdefault(int(self.shard_of[vertex]), []).append(
+                    (vertex, distance, previous_vertex)
+                )
+
+        # Vertex akhir tidak dapat dijangkau dari vertex awal
+        if bound == float("inf"):
+            return float("inf"), []
+
+        # Rekonstruksi jalur dengan menelusuri potongan jalur dari shard ke shard
+        path: List[int] = []
+        vertex: int = target
+        while vertex != -1:
+            self._inboxes[int(self.shard_of[vertex])].put(("path", self._query, vertex))
+            _, _, _, segment, vertex = self._receive()[0]
+            path.extend(segment)
+
+        path.reverse()
+
+        return bound, [str(self.names[vertex]) for vertex in path]
@@ -0,0 +1,230 @@
+import csv
+import json
+from typing import IO, Dict, List, Tuple
+
+
+# Kelas untuk merekam jejak langkah algoritma Dijkstra dalam bentuk perubahan (delta) per langkah
+# Tabel lengkap hanya dibangun saat dirender, sehingga pencarian tidak menanggung biaya O(V) per langkah
+class Dijkstra_Trace:
+    def __init__(
+        self,
+        max_steps: int | None = None,
+        sample_every: int = 1,
+        file_path: str | None = None,
+    ) -> None:
+        if max_steps is not None and max_steps < 0:
+            raise ValueError("max_steps tidak boleh negatif")
+
+        if sample_every < 1:
+            raise ValueError("sample_every minimal bernilai 1")
+
+        self.max_steps: int | None = max_steps  # Batas jumlah langkah yang direkam
+        self.sample_every: int = sample_every  # Rekam satu dari setiap n langkah
+        self.file_path: str | None = file_path  # Lokasi file default untuk write()
+
+        self.start([], None)
+
+    # Fungsi untuk mengosongkan rekaman sebelum pencarian dimulai
+    def start(self, vertices: List[str], start_vertex: str | None) -> None:
+        self.vertices: List[str] = vertices
+        self.start_vertex: str | None = start_vertex
+
+        # Setiap langkah berisi nomor langkah, vertex yang dikunjungi,
+        # vertex yang dikunjungi pada langkah yang dilewati (sampling), dan perubahan jarak
+        self.steps: List[Dict] = []
+        self.step_count: int = 0
+        self.truncated: bool = False
+
+        self._pending_settled: List[str] = []
+        self._pending_changes: Dict[str, Tuple[float, str]] = {}
+
+    # Fungsi untuk merekam satu event langkah (lihat Dijkstra_Graph.iter_steps)
+    # Hanya edge yang memperbarui jarak yang disimpan sebagai perubahan (delta)
+    def record(self, event: Dict) -> None:
+        current_vertex: str = event["vertex"]
+        changes: Dict[str, Tuple[float, str]] = {
+            neighbor: (new_distance, current_vertex)
+            for neighbor, _, new_distance, improved in event["relaxed"]
+            if improved
+        }
+
+        step: int = self.step_count
+        self.step_count += 1
+
+        if self.max_steps is not None and len(self.steps) >= self.max_steps:
+            self.truncated = True
+            return
+
+        # Perubahan dari langkah yang dilewati tetap digabung agar tabel tetap benar
+        self._pending_changes.update(changes)
+
+        if step % self.sample_every != 0:
+            self._pending_settled.append(current_vertex)
+            return
+
+        self._append(step, current_vertex)
+
+    # Fungsi untuk memastikan langkah terakhir ikut terekam saat sampling aktif
+    def finish(self) -> None:
+        if self._pending_settled and not self.truncated:
+            current_vertex: str = self._pending_settled.pop()
+            self._append(self.step_count - 1, current_vertex)
+
+    def _append(self, step: int, current_vertex: str) -> None:
+        self.steps.append(
+            {
+                "step": step,
+                "vertex": current_vertex,
+                "settled": self._pending_settled,
+                "changes": self._pending_changes,
+            }
+        )
+
+        self._pending_settled = []
+        self._pending_changes = {}
+
+    # Fungsi untuk menyusun baris tabel dengan memutar ulang perubahan per langkah
+    def rows(self, color: bool = True) -> List[List[str]]:
+        distances: Dict[str, float] = {vertex: float("inf") for vertex in self.vertices}
+        previous_vertices: Dict[str, str | None] = {
+            vertex: None for vertex in self.vertices
+        }
+        visited: set[str] = set()
+
+        if self.start_vertex is not None:
+            distances[self.start_vertex] = 0
+
+        table: List[List[str]] = []
+        for step in self.steps:
+            visited.update(step["settled"])
+            for vertex, (distance, previous_vertex) in step["changes"].items():
+                distances[vertex] = distance
+                previous_vertices[vertex] = previous_vertex
+
+            row: List[str] = [f"{step['vertex']}\n(step {step['step']})"]
+            for vertex in self.vertices:
+                if distances[vertex] == float("inf"):
+                    row.append("∞")
+                    continue
+
+                if vertex in visited:
+                    row.append("")
+                    continue
+
+                cell: str = f"{distances[vertex]}" + (
+                    f" ({previous_vertices[vertex]})"
+                    if previous_vertices[vertex] is not None
+                    else ""
+                )
+
+                # Tandai vertex yang sedang dikunjungi dengan warna kuning
+                if vertex == step["vertex"] and color:
+                    cell = "\033[93m" + cell + "\033[0m"
+
+                row.append(cell)
+
+            table.append(row)
+            visited.add(step["vertex"])
+
+        return table
+
+    # Fungsi untuk memformat baris tabel menggunakan tabulate (di-import saat pertama dipakai)
+    def format_table(self, table: List[List[str]]) -> str:
+        from tabulate import tabulate
+
+        headers: List[str] = ["V"] + self.vertices
+
+        return tabulate(
+            table,
+            headers=headers,
+            tablefmt="fancy_grid",
+            colalign=("center",) * len(headers),
+        )
+
+    # Fungsi untuk merender seluruh rekaman sekali di akhir
+    def render(self, color: bool = True) -> str:
+        text: str = self.format_table(self.rows(color))
+
+        if self.truncated:
+            text += f"\n... (dibatasi {len(self.steps)} dari {self.step_count} langkah)"
+
+        return text
+
+    # Fungsi untuk menulis tabel rekaman ke file (tanpa kode warna ANSI)
+    def write(self, file_path: str | None = None) -> None:
+        file_path = file_path or self.file_path
+        if file_path is None:
+            raise ValueError("file_path belum ditentukan")
+
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write(self.render(color=False))
+            file.write("\n")
+
+
+# Kelas sink untuk menulis event langkah Dijkstra ke file JSON Lines (satu objek JSON per langkah)
+# Setiap event langsung ditulis ke file, sehingga memori tidak bertambah seiring jumlah langkah
+class Dijkstra_JSONL_Sink:
+    def __init__(self, file_path: str) -> None:
+        self.file_path: str = file_path  # Lokasi file output
+        self.step_count: int = 0  # Jumlah event yang sudah ditulis
+        self._file: IO[str] | None = None
+
+    # Fungsi untuk membuka file output sebelum pencarian dimulai
+    def start(self, vertices: List[str], start_vertex: str | None) -> None:
+        self.step_count = 0
+        self._file = open(self.file_path, "w", encoding="utf-8")
+
+    # Fungsi untuk menulis satu event sebagai satu baris JSON
+    def record(self, event: Dict) -> None:
+        self._file.write(json.dumps(event, ensure_ascii=False))
+        self._file.write("\n")
+        self.step_count += 1
+
+    # Fungsi untuk menutup file output setelah pencarian selesai
+    def finish(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# Kelas sink untuk menulis event langkah Dijkstra ke file CSV (satu baris per edge yang direlaksasi)
+# Langkah tanpa edge yang direlaksasi tetap ditulis satu baris dengan kolom tetangga kosong
+class Dijkstra_CSV_Sink:
+    headers: List[str] = [
+        "step",
+        "vertex",
+        "distance",
+        "neighbor",
+        "weight",
+        "new_distance",
+        "improved",
+    ]
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path: str = file_path  # Lokasi file output
+        self.step_count: int = 0  # Jumlah event yang sudah ditulis
+        self._file: IO[str] | None = None
+
+    # Fungsi untuk membuka file output dan menulis header sebelum pencarian dimulai
+    def start(self, vertices: List[str], start_vertex: str | None) -> None:
+        self.step_count = 0
+        self._file = open(self.file_path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.headers)
+
+    # Fungsi untuk menulis satu event sebagai baris CSV
+    def record(self, event: Dict) -> None:
+        prefix: List = [event["step"], event["vertex"], event["distance"]]
+        if not event["relaxed"]:
+            self._writer.writerow(prefix + ["", "", "", ""])
+
+        for neighbor, weight, new_distance, improved in event["relaxed"]:
+            self._writer.writerow(prefix + [neighbor, weight, new_distance, improved])
+
+        self.step_count += 1
+
+    # Fungsi untuk menutup file output setelah pencarian selesai
+    def finish(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
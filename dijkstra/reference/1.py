@@ -1,5 +1,5 @@
+import heapq
 import time
-from copy import copy
 from prettytable import PrettyTable
 
 
@@ -13,10 +13,20 @@ class Dijkstra:
         self.end = ""
 
         self.distancewNode = {}
+        self.order = {}
+        self.queue = []
         self.table = PrettyTable()
         self.tableData = []
         self.firstColData = []
 
+        self.incrementalTable = False
+        self.columnIndex = {}
+        self.rowData = []
+        self.pendingRow = ""
+
+        # jumlah angka di belakang koma untuk jarak bertipe float pada table
+        self.distancePrecision = 2
+
     # Menampilkan table
     def showTable(self, i, shortestNode, notVisited):
         self.field = [node for node in self.graph]
@@ -39,13 +49,66 @@ class Dijkstra:
 
         self.table._field_names.insert(0, "/")
         self.table._align["/"] = "c"
-        self.table._valign["/"] = "v"
+        self.table._valign["/"] = "m"
 
         for j, x in enumerate(self.table._rows):
             self.table._rows[j].insert(0, self.firstColData[j])
 
         print(self.table) if i > 0 else ""
 
+    # Menampilkan table secara bertahap, hanya baris baru yang dicetak pada setiap langkah
+    # baris disusun pada list yang sudah dialokasikan dan diindeks per kolom, sehingga setiap langkah bekerja O(V)
+    def showTableIncremental(self, i, shortestNode, notVisited):
+        if i == 0:
+            self.field = [node for node in self.graph]
+            self.columnIndex = {node: j for j, node in enumerate(self.field)}
+            self.rowData = ["" for node in self.field]
+
+            # lebar kolom tetap, jarak terpendek tidak mungkin melebihi jumlah seluruh bobot rute
+            totalDistance = sum(sum(paths.values()) for paths in self.graph.values())
+            nameWidth = max(len(node) for node in self.field)
+            cellWidth = len(self.formatDistance(totalDistance)) + 1 + nameWidth
+            self.columnWidth = [max(1, nameWidth)] + [
+                max(len(node), cellWidth) for node in self.field
+            ]
+            self.border = (
+                "+" + "+".join("-" * (width + 2) for width in self.columnWidth) + "+"
+            )
+
+        # mencetak baris dari langkah sebelumnya, header hanya dicetak sekali di awal
+        if i > 0:
+            if i == 1:
+                print(self.border)
+                print(self.formatRow(["/"] + self.field, []))
+                print(self.border)
+
+            print(self.pendingRow)
+            print(self.border)
+
+        for x, y in self.distancewNode.items():
+            self.rowData[self.columnIndex[x]] = str(y)
+
+        visitedColumns = [
+            j + 1 for j, node in enumerate(self.field) if node not in notVisited
+        ]
+        self.pendingRow = self.formatRow([shortestNode] + self.rowData, visitedColumns)
+
+    # Memformat satu baris table dengan lebar kolom tetap, kolom pada visitedColumns diberi warna merah
+    def formatRow(self, cells, visitedColumns):
+        cells = [cell.center(width) for cell, width in zip(cells, self.columnWidth)]
+        for j in visitedColumns:
+            cells[j] = f"\033[31m{cells[j]}\033[0m"
+
+        return "| " + " | ".join(cells) + " |"
+
+    # Memformat jarak untuk table, jarak float dibulatkan agar panjangnya tidak melebihi lebar kolom
+    # (misalnya 0.1 + 0.2 menjadi 0.30, bukan 0.30000000000000004)
+    def formatDistance(self, distance):
+        if isinstance(distance, float):
+            return f"{distance:.{self.distancePrecision}f}"
+
+        return str(distance)
+
     # Menambahkan node/titik baru
     def insertNewNode(self, node):
         if not node.isalpha():
@@ -70,30 +133,44 @@ class Dijkstra:
 
     # Menginisialisasi jarak rute, titik mulai, dan titik akhir
     def initDistancePath(self, start, end):
-        # membuat seluruh nilai distance menjadi infinity (99) kecuali jarak di titik awal, yaitu 0
+        # membuat seluruh nilai distance menjadi infinity kecuali jarak di titik awal, yaitu 0
         for node in self.graph:
-            self.distance[node] = 99
+            self.distance[node] = float("inf")
+            self.distancewNode[node] = "∞"
             self.path[node] = {}
 
         self.distance[start] = 0
+        self.distancewNode[start] = 0
         self.start = start
         self.end = end
-        self.distancewNode = copy(self.distance)
+
+        # urutan node dipakai sebagai pemecah seri, node yang lebih akhir didahulukan saat jaraknya sama
+        self.order = {node: i for i, node in enumerate(self.graph)}
+
+        # heap berisi (jarak, -urutan, node), seluruh node dimasukkan agar node yang tidak terjangkau tetap dikunjungi
+        self.queue = [
+            (self.distance[node], -self.order[node], node) for node in self.graph
+        ]
+        heapq.heapify(self.queue)
 
     # Mencari node dengan jarak terpendek
     def findShortestNode(self, notVisited):
-        lowestDistance = 99
-        shortestNode = ""
-        for node in self.distance:
-            # jika node ada di dalam variable notVisited dan jarak dari node lebih rendah atau sama dengan dari lowestDistance
-            if node in notVisited and self.distance[node] <= lowestDistance:
-                lowestDistance = self.distance[node]
-                shortestNode = node
+        # buang entri heap yang sudah usang (node sudah dikunjungi atau jaraknya sudah diperbaharui)
+        while self.queue and (
+            self.queue[0][2] not in notVisited
+            or self.queue[0][0] != self.distance[self.queue[0][2]]
+        ):
+            heapq.heappop(self.queue)
+
+        if not self.queue:
+            return ""
 
-        return shortestNode
+        return self.queue[0][2]
 
     # Mencari rute terpendek dari titik awal ke titik akhir
-    def route(self, start, end, showAllRoute=False):
+    # delay (detik) adalah jeda antar langkah untuk presentasi, bernilai 0 agar berjalan dengan kecepatan penuh
+    # jika incrementalTable bernilai True, setiap langkah hanya mencetak baris baru (lihat showTableIncremental)
+    def route(self, start, end, showAllRoute=False, delay=0, incrementalTable=False):
         if start not in self.graph:
             print(f"{start} tidak ada di dalam Graph!")
 
@@ -109,8 +186,11 @@ class Dijkstra:
 
             return ValueError
 
+        self.incrementalTable = incrementalTable
+        showTable = self.showTableIncremental if incrementalTable else self.showTable
+
         self.initDistancePath(start, end)
-        notVisited = [node for node in self.distance]
+        notVisited = set(self.distance)
         shortestNode = self.findShortestNode(notVisited)
         i = 0
 
@@ -123,20 +203,27 @@ class Dijkstra:
                 # memperbaharui jarak yang dimiliki node dalam variabel distance dan rute yang dimiliki node
                 if self.distance[node] > shortestNodeDistance + destination[node]:
                     self.distance[node] = shortestNodeDistance + destination[node]
-                    self.distancewNode[node] = f"{self.distance[node]}/{shortestNode}"
+                    self.distancewNode[node] = (
+                        f"{self.formatDistance(self.distance[node])}/{shortestNode}"
+                    )
                     self.path[node] = shortestNode
 
-            self.showTable(i, shortestNode, notVisited)
+                    heapq.heappush(
+                        self.queue, (self.distance[node], -self.order[node], node)
+                    )
+
+            showTable(i, shortestNode, notVisited)
             print(f"Menuju ke node {shortestNode}")
             print("")
 
-            notVisited.pop(notVisited.index(shortestNode))
+            notVisited.remove(shortestNode)
             shortestNode = self.findShortestNode(notVisited)
             i += 1
 
-            time.sleep(0.2)
+            if delay > 0:
+                time.sleep(delay)
 
-        self.showTable(i, shortestNode, notVisited)
+        showTable(i, shortestNode, notVisited)
 
         # Menampilkan seluruh rute dari titik awal ke seluruh titik yang ada dalam graf jika showAllRoute bernilai True
         if showAllRoute:
@@ -147,8 +234,8 @@ class Dijkstra:
                 if self.start == self.end:
                     continue
 
-                # Pengkondisian penentuan alur, jika jarak menuju node tujuan lebih dari/sama dengan 99, maka artinya node awal tidak memiliki akses/jalur menuju ke node akhir melalui jalur apapun
-                if self.distance[self.end] < 99:
+                # Pengkondisian penentuan alur, jika jarak menuju node tujuan bernilai infinity, maka artinya node awal tidak memiliki akses/jalur menuju ke node akhir melalui jalur apapun
+                if self.distance[self.end] < float("inf"):
                     # Mencari rute berdasarkan susunan rute terpendek yang telah dihitung
                     pathList = [self.end]
                     while start not in pathList:
@@ -169,7 +256,7 @@ class Dijkstra:
                 return
 
             # Mencari rute berdasarkan susunan rute terpendek yang telah dihitung
-            if self.distance[self.end] < 99:
+            if self.distance[self.end] < float("inf"):
                 pathList = [self.end]
                 i = 0
 
@@ -226,5 +313,5 @@ dijkstra.insertNodePath("I", "J", 5)
 
 dijkstra.insertNewNode("J")
 
-dijkstra.route("A", "J")
-# dijkstra.route("A", "J", showAllRoute=True)
+dijkstra.route("A", "J", delay=0.2)
+# dijkstra.route("A", "J", showAllRoute=True, delay=0.2)
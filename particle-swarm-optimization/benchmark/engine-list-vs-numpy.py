@@ -0,0 +1,100 @@
+import importlib.util
+import numpy as np
+import os
+import sys
+import time
+from tabulate import tabulate
+from typing import Dict, List
+
+# Tambahkan folder particle-swarm-optimization ke sys.path agar modul pso_history dapat di-import
+pso_directory: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, pso_directory)
+
+# Muat modul PSO satu variabel dari file script (nama file mengandung tanda "-")
+module_path: str = os.path.join(
+    pso_directory, "pso-kelas-a-kelompok-2-soal-1-bagian-b.py"
+)
+spec = importlib.util.spec_from_file_location("pso_single_variable", module_path)
+pso_single_variable = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(pso_single_variable)
+
+# Parameter benchmark: fungsi dan koefisien sama dengan soal, jumlah partikel diperbesar
+particle_amounts: List[int] = [100, 1000, 10000]
+iteration_amount: int = 20
+seed: int = 42
+
+fitness_function = lambda x: (3 * (x**2) + (2 * x) - 2) ** 2
+
+table: List[List[str]] = []
+for particle_amount in particle_amounts:
+    durations: Dict[str, float] = {}
+    g_bests: Dict[str, float] = {}
+    for engine in ("list", "numpy"):
+        # Seed yang sama untuk kedua mesin, sehingga lintasan partikel dapat dibandingkan
+        np.random.seed(seed)
+        pso = pso_single_variable.PSO_Single_Variable(
+            fitness_function,
+            -2,
+            2,
+            particle_amount,
+            0.5,
+            1,
+            0,
+            1,
+            1,
+            iteration_amount,
+            engine,
+        )
+
+        start_time: float = time.perf_counter()
+        pso.optimize()
+        durations[engine] = time.perf_counter() - start_time
+        g_bests[engine] = float(pso.current_g_best)
+
+        # Riwayat gBest pada iterasi terakhir harus berisi solusi akhir optimasi
+        if pso.g_best[-1] != pso.current_g_best:
+            raise RuntimeError(
+                f"g_best[-1] ({pso.g_best[-1]}) berbeda dari gBest akhir "
+                f"({pso.current_g_best}) pada mesin {engine}"
+            )
+
+    table.append(
+        [
+            particle_amount,
+            f"{durations['list'] * 1000:.1f}",
+            f"{durations['numpy'] * 1000:.1f}",
+            f"{durations['list'] / durations['numpy']:.1f}x",
+            "ya" if np.isclose(g_bests["list"], g_bests["numpy"]) else "tidak",
+        ]
+    )
+
+print(
+    tabulate(
+        table,
+        headers=["Partikel", "list (ms)", "numpy (ms)", "Percepatan", "gBest sama"],
+        tablefmt="fancy_grid",
+        colalign=("center", "center", "center", "center", "center"),
+    )
+)
+
+# Regresi: mode riwayat "final" tetap menyimpan pBest dan gBest akhir
+np.random.seed(seed)
+pso = pso_single_variable.PSO_Single_Variable(
+    fitness_function,
+    -2,
+    2,
+    particle_amounts[0],
+    0.5,
+    1,
+    0,
+    1,
+    1,
+    iteration_amount,
+    "numpy",
+    "final",
+)
+pso.optimize()
+if pso.g_best[-1] != pso.current_g_best or not np.array_equal(
+    pso.p_best[:, -1], pso.current_p_best
+):
+    raise RuntimeError("Mode riwayat final tidak menyimpan pBest/gBest akhir")
@@ -2,6 +2,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 from matplotlib.animation import FuncAnimation
+from pso_fitness import PSO_Batch_Fitness, PSO_Parallel_Fitness
+from pso_history import PSO_History
 from tabulate import tabulate
 
 
@@ -18,6 +20,13 @@ class PSO_Single_Variable:
         r_maximum,  # Batas maksimal bilangan acak untuk eksplorasi
         w,  # Faktor inersia untuk mengontrol dampak kecepatan sebelumnya
         iteration_amount,  # Total iterasi yang akan dilakukan dalam optimasi
+        engine="list",  # Mesin komputasi: "list" (per partikel) atau "numpy" (seluruh swarm)
+        history_mode="full",  # Pencatatan riwayat: "full", "interval", atau "final"
+        history_interval=1,  # Jarak antar iterasi yang dicatat pada mode "interval"
+        fitness_mode="auto",  # Pemanggilan fitness: "auto", "batch", atau "scalar"
+        fitness_evaluator="serial",  # Evaluasi fitness: "serial", "thread", atau "process"
+        worker_amount=None,  # Jumlah worker pool evaluasi paralel, default jumlah CPU
+        chunk_size=None,  # Jumlah partikel per tugas pada evaluasi paralel
     ):
         # Simpan parameter-parameter algoritma PSO untuk digunakan selama proses optimasi
 
@@ -25,6 +34,22 @@ class PSO_Single_Variable:
         # Semakin rendah nilainya, semakin baik solusinya
         self.fitness_function = fitness_function
 
+        # Fungsi fitness untuk seluruh swarm sekaligus, lihat PSO_Batch_Fitness
+        # Fungsi skalar (per partikel) tetap didukung melalui np.vectorize
+        # Untuk fungsi objektif yang mahal, evaluasi dapat dibagi ke pool thread atau proses
+        if fitness_evaluator == "serial":
+            self.batch_fitness_function = PSO_Batch_Fitness(
+                fitness_function, fitness_mode
+            )
+        else:
+            self.batch_fitness_function = PSO_Parallel_Fitness(
+                fitness_function,
+                fitness_mode,
+                fitness_evaluator,
+                worker_amount,
+                chunk_size,
+            )
+
         # Batasan ruang pencarian solusi untuk mencegah partikel keluar dari rentang yang valid
         self.parameter_minimum = parameter_minimum
         self.parameter_maximum = parameter_maximum
@@ -52,103 +77,218 @@ class PSO_Single_Variable:
         # Menentukan berapa lama algoritma mencari solusi optimal
         self.iteration_amount = iteration_amount
 
+        # Mesin komputasi optimasi
+        # "list" memperbarui partikel satu per satu, "numpy" memperbarui seluruh swarm
+        # sekaligus dengan operasi array sehingga cocok untuk jumlah partikel yang besar
+        if engine not in ("list", "numpy"):
+            raise ValueError(f"Engine tidak dikenal: {engine}")
+
+        self.engine = engine
+
+        # Mode pencatatan riwayat optimasi, lihat PSO_History
+        # Mode "interval" dan "final" menghemat memori untuk optimasi yang panjang
+        self.history_mode = history_mode
+        self.history_interval = history_interval
+
         # Inisialisasi posisi awal partikel secara acak dalam rentang parameter
         # Setiap partikel memulai dari posisi yang berbeda untuk diversitas
-        self.x = [
-            [
-                round(
-                    np.random.uniform(self.parameter_minimum, self.parameter_maximum), 4
-                )
-            ]
-            for _ in range(self.particle_amount)
-        ]
+        # Bilangan acak diambil dengan urutan yang sama pada kedua mesin
+        if self.engine == "numpy":
+            self.current_x = np.round(
+                np.random.uniform(
+                    self.parameter_minimum, self.parameter_maximum, self.particle_amount
+                ),
+                4,
+            )
+        else:
+            self.current_x = np.array(
+                [
+                    round(
+                        np.random.uniform(
+                            self.parameter_minimum, self.parameter_maximum
+                        ),
+                        4,
+                    )
+                    for _ in range(self.particle_amount)
+                ]
+            )
 
         # Inisialisasi kecepatan awal semua partikel dengan 0
         # Partikel mulai dari kondisi diam sebelum bergerak
-        self.v = [[0] for _ in range(self.particle_amount)]
+        self.current_v = np.zeros(self.particle_amount)
 
-        # Struktur untuk menyimpan posisi terbaik pribadi setiap partikel
+        # Posisi terbaik pribadi setiap partikel, diisi pada iterasi pertama
         # Memungkinkan pelacakan pencapaian terbaik setiap partikel
-        self.p_best = [[] for _ in range(self.particle_amount)]
+        self.current_p_best = None
 
-        # Struktur untuk menyimpan posisi terbaik global dari seluruh swarm
+        # Posisi terbaik global dari seluruh swarm, diisi pada iterasi pertama
         # Akan diperbarui setiap iterasi jika ditemukan solusi lebih baik
-        self.g_best = []
-
-    def execute_fitness_function(self, x):
-        # Menjalankan fungsi fitness dengan pembulatan hasil
-        # Memastikan konsistensi presisi dalam perhitungan
-        return round(self.fitness_function(x), 4)
+        self.current_g_best = None
+
+        # Cache nilai fitness pBest dan gBest, disimpan bersama posisinya
+        # sehingga setiap posisi hanya dievaluasi sekali per iterasi
+        self.current_p_best_fitness = None
+        self.current_g_best_fitness = None
+
+        # Jumlah pemanggilan fungsi fitness (satu per posisi yang dievaluasi)
+        self.evaluation_amount = 0
+
+        # Riwayat posisi, kecepatan, pBest, dan gBest dalam array yang dialokasikan di awal
+        self.reset_history()
+
+    def reset_history(self):
+        # Membuat penyimpan riwayat baru yang dimulai dari posisi dan kecepatan saat ini
+        self.history = PSO_History(
+            self.particle_amount,
+            1,
+            self.iteration_amount,
+            self.history_mode,
+            self.history_interval,
+        )
+        self.history.record_swarm(0, (self.current_x,), (self.current_v,))
+
+    # Atribut riwayat x, v, p_best, dan g_best adalah view dari penyimpan riwayat
+    # x, v, dan p_best berbentuk (partikel, iterasi tercatat), g_best berbentuk (iterasi,)
+    # sehingga akses self.x[i][t] pada tabel dan plot tetap berlaku
+    @property
+    def x(self):
+        return self.history.positions[:, :, 0].T
+
+    @property
+    def v(self):
+        return self.history.velocities[:, :, 0].T
+
+    @property
+    def p_best(self):
+        return self.history.p_best[:, :, 0].T
+
+    @property
+    def g_best(self):
+        return self.history.g_best[:, 0]
+
+    def execute_fitness_function_array(self, x):
+        # Menjalankan fungsi fitness untuk seluruh posisi sekaligus dengan pembulatan hasil
+        # Hasilnya berupa vektor fitness dengan satu nilai untuk setiap posisi
+        self.evaluation_amount += len(x)
+        return np.round(self.batch_fitness_function(x), 4)
+
+    def get_fitness_of_positions(self):
+        # Menghitung nilai fitness posisi saat ini untuk seluruh partikel sekaligus
+        # Dijalankan sekali per iterasi, hasilnya dipakai untuk pBest dan disimpan di riwayat
+        return self.execute_fitness_function_array(self.current_x)
 
     def get_latest_p_best(self):
         # Mengambil posisi terbaik personal terbaru dari setiap partikel
         # Berguna untuk membandingkan dan memperbarui solusi
-        return list(map(lambda arr: arr[-1], self.p_best))
+        return self.current_p_best
 
     def get_latest_fitness_of_p_best(self):
-        # Menghitung nilai fitness dari posisi terbaik personal terbaru
+        # Mengambil nilai fitness dari posisi terbaik personal terbaru dari cache
         # Membantu dalam mengevaluasi kualitas solusi individu
-        return list(map(self.execute_fitness_function, self.get_latest_p_best()))
+        return self.current_p_best_fitness
 
     def get_best_value_latest_fitness_of_p_best(self):
         # Menemukan nilai fitness terbaik dari posisi personal terbaik
         # Digunakan untuk membandingkan dengan solusi global
-        return min(self.get_latest_fitness_of_p_best())
+        return np.min(self.get_latest_fitness_of_p_best())
 
     def get_latest_g_best(self):
         # Mengambil posisi terbaik global terbaru
         # Solusi terbaik yang ditemukan oleh seluruh swarm
-        return self.g_best[-1]
+        return self.current_g_best
 
     def get_latest_fitness_of_g_best(self):
-        # Menghitung nilai fitness dari posisi terbaik global
+        # Mengambil nilai fitness dari posisi terbaik global dari cache
         # Mengukur kualitas solusi terbaik keseluruhan
-        return self.execute_fitness_function(self.get_latest_g_best())
+        return self.current_g_best_fitness
 
     def set_latest_g_best(self):
         # Proses pemilihan dan pembaruan posisi terbaik global
-        if len(self.g_best) == 0:
+        best_index = np.argmin(self.get_latest_fitness_of_p_best())
+
+        if self.current_g_best is None:
             # Pada iterasi pertama, pilih partikel dengan fitness terbaik
-            self.g_best.append(
-                self.get_latest_p_best()[np.argmin(self.get_latest_fitness_of_p_best())]
-            )
+            self.current_g_best = self.get_latest_p_best()[best_index]
+            self.current_g_best_fitness = self.get_latest_fitness_of_p_best()[
+                best_index
+            ]
         else:
             # Pada iterasi selanjutnya, perbarui g_best jika ditemukan solusi lebih baik
             if (self.get_latest_fitness_of_g_best()) <= (
                 self.get_best_value_latest_fitness_of_p_best()
             ):
                 # Pilih partikel dengan fitness terbaik sebagai g_best
-                self.g_best.append(
-                    self.get_latest_p_best()[
-                        np.argmin(self.get_latest_fitness_of_p_best())
-                    ]
-                )
-            else:
-                # Pertahankan g_best sebelumnya jika tidak ada perbaikan
-                self.g_best.append(self.get_latest_g_best())
+                self.current_g_best = self.get_latest_p_best()[best_index]
+                self.current_g_best_fitness = self.get_latest_fitness_of_p_best()[
+                    best_index
+                ]
+
+            # Selain itu, g_best sebelumnya dipertahankan jika tidak ada perbaikan
 
     def optimize(self):
         # Algoritma utama Particle Swarm Optimization
         # Melakukan iterasi untuk mengeksplorasi dan mengeksploitasi ruang solusi
+        # Riwayat selalu menggambarkan pemanggilan optimize terakhir, sehingga
+        # pemanggilan berikutnya melanjutkan dari posisi saat ini dengan riwayat baru
+        if self.current_g_best is not None:
+            self.reset_history()
+
+        # Pool evaluasi fitness paralel hanya hidup selama optimasi berjalan
+        # dan selalu dihentikan dengan rapi, termasuk saat terjadi error
+        try:
+            if self.engine == "numpy":
+                self.optimize_numpy()
+            else:
+                self.optimize_list()
+
+            self.record_final_best()
+        finally:
+            self.batch_fitness_function.close()
+
+    def record_final_best(self):
+        # Mencatat pBest dan gBest hasil optimasi pada slot iterasi terakhir
+        # sehingga p_best[i][-1] dan g_best[-1] berisi solusi akhir, termasuk pada mode "final"
+        # Fitness posisi akhir tidak dihitung, sehingga tetap NaN di riwayat
+        if self.current_p_best is None:
+            return
+
+        self.history.record_best(
+            self.iteration_amount, (self.current_p_best,), (self.current_g_best,)
+        )
+        self.history.record_fitness(
+            self.iteration_amount,
+            np.nan,
+            self.current_p_best_fitness,
+            self.current_g_best_fitness,
+        )
+
+    def optimize_list(self):
+        # Versi per partikel dari optimize: kecepatan dan posisi setiap partikel
+        # diperbarui satu per satu dengan nilai skalar
         for t in range(self.iteration_amount):
             # Fase 1: Update Personal Best (pBest)
-            for i in range(self.particle_amount):
-                if len(self.p_best[i]) == 0:
-                    # Inisialisasi pBest untuk partikel pada iterasi pertama
-                    self.p_best[i].append(self.x[i][-1])
-                else:
+            # Fitness posisi saat ini dievaluasi sekali, fitness pBest diambil dari cache
+            fitness = self.get_fitness_of_positions()
+
+            if self.current_p_best is None:
+                # Inisialisasi pBest untuk seluruh partikel pada iterasi pertama
+                self.current_p_best = self.current_x.copy()
+                self.current_p_best_fitness = fitness.copy()
+            else:
+                for i in range(self.particle_amount):
                     # Perbarui pBest jika posisi saat ini memiliki fitness lebih baik
-                    if (self.execute_fitness_function(self.p_best[i][-1])) <= (
-                        self.execute_fitness_function(self.x[i][-1])
-                    ):
-                        # Pertahankan pBest sebelumnya
-                        self.p_best[i].append(self.p_best[i][-1])
-                    else:
+                    # pBest sebelumnya dipertahankan jika fitness-nya tidak lebih buruk
+                    if (self.current_p_best_fitness[i]) > (fitness[i]):
                         # Update pBest dengan posisi terbaru
-                        self.p_best[i].append(self.x[i][-1])
+                        self.current_p_best[i] = self.current_x[i]
+                        self.current_p_best_fitness[i] = fitness[i]
 
             # Fase 2: Update Global Best (gBest)
             self.set_latest_g_best()
+            self.history.record_best(t, (self.current_p_best,), (self.current_g_best,))
+            self.history.record_fitness(
+                t, fitness, self.current_p_best_fitness, self.current_g_best_fitness
+            )
 
             # Fase 3: Update Kecepatan dan Posisi Partikel
             for i in range(self.particle_amount):
@@ -159,32 +299,98 @@ class PSO_Single_Variable:
 
                 # Perbarui kecepatan partikel dengan persamaan PSO
                 # Kombinasi dari inersia, kognitif, dan komponen sosial
-                self.v[i].append(
-                    np.clip(
-                        (
-                            # Inersia: mempertahankan momentum sebelumnya
-                            (self.w * self.v[i][-1])
-                            # Komponen Kognitif: tarik ke posisi terbaik pribadi
-                            + (self.c1 * r1 * (self.p_best[i][-1] - self.x[i][-1]))
-                            # Komponen Sosial: tarik ke posisi terbaik global
-                            + (self.c2 * r2 * (self.g_best[-1] - self.x[i][-1]))
-                        ),
-                        # Pastikan kecepatan dalam batas yang diizinkan
-                        self.parameter_minimum,
-                        self.parameter_maximum,
-                    )
+                self.current_v[i] = np.clip(
+                    (
+                        # Inersia: mempertahankan momentum sebelumnya
+                        (self.w * self.current_v[i])
+                        # Komponen Kognitif: tarik ke posisi terbaik pribadi
+                        + (self.c1 * r1 * (self.current_p_best[i] - self.current_x[i]))
+                        # Komponen Sosial: tarik ke posisi terbaik global
+                        + (self.c2 * r2 * (self.current_g_best - self.current_x[i]))
+                    ),
+                    # Pastikan kecepatan dalam batas yang diizinkan
+                    self.parameter_minimum,
+                    self.parameter_maximum,
                 )
 
                 # Perbarui posisi partikel berdasarkan kecepatan baru
                 # Pastikan posisi masih dalam rentang parameter
-                self.x[i].append(
-                    np.clip(
-                        (self.x[i][-1] + self.v[i][-1]),
-                        self.parameter_minimum,
-                        self.parameter_maximum,
-                    )
+                self.current_x[i] = np.clip(
+                    (self.current_x[i] + self.current_v[i]),
+                    self.parameter_minimum,
+                    self.parameter_maximum,
+                )
+
+            self.history.record_swarm(t + 1, (self.current_x,), (self.current_v,))
+
+    def optimize_numpy(self):
+        # Versi vektor dari optimize: posisi, kecepatan, dan pBest disimpan sebagai
+        # array (partikel,) dan seluruh swarm diperbarui sekaligus setiap iterasi
+        # Aturan pBest, gBest, pembulatan, dan clipping sama persis dengan mesin "list"
+        for t in range(self.iteration_amount):
+            # Fase 1: Update Personal Best (pBest)
+            # Fitness posisi saat ini dievaluasi sekali, fitness pBest diambil dari cache
+            fitness = self.get_fitness_of_positions()
+
+            if self.current_p_best is None:
+                # Inisialisasi pBest untuk seluruh partikel pada iterasi pertama
+                self.current_p_best = self.current_x.copy()
+                self.current_p_best_fitness = fitness.copy()
+            else:
+                # Pertahankan pBest jika fitness-nya tidak lebih buruk dari posisi saat ini
+                keep_p_best = self.current_p_best_fitness <= fitness
+                self.current_p_best = np.where(
+                    keep_p_best, self.current_p_best, self.current_x
+                )
+                self.current_p_best_fitness = np.where(
+                    keep_p_best, self.current_p_best_fitness, fitness
                 )
 
+            # Fase 2: Update Global Best (gBest)
+            best_index = np.argmin(self.current_p_best_fitness)
+
+            # Pada iterasi pertama pilih pBest terbaik, selanjutnya gunakan aturan
+            # yang sama dengan set_latest_g_best
+            if self.current_g_best is None or (
+                self.current_g_best_fitness <= self.current_p_best_fitness[best_index]
+            ):
+                self.current_g_best = self.current_p_best[best_index]
+                self.current_g_best_fitness = self.current_p_best_fitness[best_index]
+
+            self.history.record_best(t, (self.current_p_best,), (self.current_g_best,))
+            self.history.record_fitness(
+                t, fitness, self.current_p_best_fitness, self.current_g_best_fitness
+            )
+
+            # Fase 3: Update Kecepatan dan Posisi Partikel
+            # r1 dan r2 diambil berpasangan per partikel, sama seperti urutan pada mesin "list"
+            r = np.round(
+                np.random.uniform(
+                    self.r_minimum, self.r_maximum, (self.particle_amount, 2)
+                ),
+                4,
+            )
+            r1 = r[:, 0]
+            r2 = r[:, 1]
+
+            # Perbarui kecepatan seluruh partikel dengan persamaan PSO
+            self.current_v = np.clip(
+                (self.w * self.current_v)
+                + (self.c1 * r1 * (self.current_p_best - self.current_x))
+                + (self.c2 * r2 * (self.current_g_best - self.current_x)),
+                self.parameter_minimum,
+                self.parameter_maximum,
+            )
+
+            # Perbarui posisi seluruh partikel berdasarkan kecepatan baru
+            self.current_x = np.clip(
+                self.current_x + self.current_v,
+                self.parameter_minimum,
+                self.parameter_maximum,
+            )
+
+            self.history.record_swarm(t + 1, (self.current_x,), (self.current_v,))
+
     def show_table(self):
         # Fungsi untuk menampilkan rincian proses optimasi dalam tabel
         # Membantu dalam memahami evolusi setiap partikel
@@ -203,7 +409,12 @@ class PSO_Single_Variable:
         ]
         table = []
 
+        # Tabel menampilkan setiap iterasi beserta posisi sesudahnya
+        if not self.history.is_full():
+            raise ValueError('Tabel per iterasi membutuhkan riwayat dengan mode "full"')
+
         # Susun data untuk setiap iterasi dan partikel
+        # Nilai fitness diambil dari riwayat, sehingga fungsi fitness tidak dijalankan lagi
         for t in range(self.iteration_amount):
             first_row = True
             for i in range(self.particle_amount):
@@ -212,16 +423,12 @@ class PSO_Single_Variable:
                         t + 1 if first_row else "",
                         f"Ke-{i + 1} ({i})",
                         self.x[i][t],
-                        self.execute_fitness_function(self.x[i][t]),
+                        self.history.fitness[t, i],
                         self.v[i][t],
                         self.p_best[i][t],
-                        self.execute_fitness_function(self.p_best[i][t]),
+                        self.history.p_best_fitness[t, i],
                         self.g_best[t] if first_row else "",
-                        (
-                            self.execute_fitness_function(self.g_best[t])
-                            if first_row
-                            else ""
-                        ),
+                        self.history.g_best_fitness[t] if first_row else "",
                         self.x[i][t + 1],
                         self.v[i][t + 1],
                     ]
@@ -289,11 +496,17 @@ class PSO_Single_Variable:
         def update(frame):
             # Fungsi update untuk animasi pergerakan
             # Memperbarui posisi setiap partikel pada setiap frame
+            # Frame adalah slot riwayat, sumbu x memakai nomor iterasi yang tercatat
             for i in range(self.particle_amount):
-                lines[i].set_data(list(range(frame + 1)), self.x[i][: frame + 1])
+                lines[i].set_data(
+                    self.history.iterations[: frame + 1], self.x[i][: frame + 1]
+                )
 
-            # Perbarui posisi global terbaik
-            line_g_best.set_data(list(range(frame + 1)), self.g_best[: frame + 1])
+            # Perbarui posisi global terbaik, gBest tercatat di setiap iterasi
+            iteration = self.history.iterations[frame]
+            line_g_best.set_data(
+                list(range(iteration + 1)), self.g_best[: iteration + 1]
+            )
 
             return lines
 
@@ -301,7 +514,7 @@ class PSO_Single_Variable:
         ani = FuncAnimation(
             fig,
             update,
-            frames=range(self.iteration_amount + 1),
+            frames=range(len(self.history.iterations)),
             interval=25,  # Kontrol kecepatan animasi
             blit=True,  # Optimasi performa animasi
         )
@@ -310,36 +523,38 @@ class PSO_Single_Variable:
         plt.show()
 
 
-# Definisi fungsi fitness untuk dioptimasi
-# Dalam kasus ini: f(x) = (3x² + 2x - 2)²
-# Fungsi ini memiliki beberapa minimum lokal dan global
-fitness_function = lambda x: (3 * (x**2) + (2 * x) - 2) ** 2
-
-# Parameter optimasi PSO yang akan digunakan
-parameter_minimum = -2  # Batas minimal pencarian solusi
-parameter_maximum = 2  # Batas maksimal pencarian solusi
-particle_amount = 10  # Jumlah partikel dalam swarm
-c1 = 0.5  # Koefisien kognitif (pengaruh memori pribadi)
-c2 = 1  # Koefisien sosial (pengaruh informasi global)
-r_minimum = 0  # Batas minimal bilangan acak
-r_maximum = 1  # Batas maksimal bilangan acak
-w = 1  # Faktor inersia
-iteration_amount = 100  # Total iterasi optimasi
-
-# Inisialisasi dan eksekusi algoritma PSO
-pso_1_b = PSO_Single_Variable(
-    fitness_function,
-    parameter_minimum,
-    parameter_maximum,
-    particle_amount,
-    c1,
-    c2,
-    r_minimum,
-    r_maximum,
-    w,
-    iteration_amount,
-)
-
-pso_1_b.optimize()
-pso_1_b.show_table()
-pso_1_b.show_plot_per_iteration()
+# Script hanya dijalankan langsung, agar kelas dapat di-import tanpa menjalankan demo
+if __name__ == "__main__":
+    # Definisi fungsi fitness untuk dioptimasi
+    # Dalam kasus ini: f(x) = (3x² + 2x - 2)²
+    # Fungsi ini memiliki beberapa minimum lokal dan global
+    fitness_function = lambda x: (3 * (x**2) + (2 * x) - 2) ** 2
+
+    # Parameter optimasi PSO yang akan digunakan
+    parameter_minimum = -2  # Batas minimal pencarian solusi
+    parameter_maximum = 2  # Batas maksimal pencarian solusi
+    particle_amount = 10  # Jumlah partikel dalam swarm
+    c1 = 0.5  # Koefisien kognitif (pengaruh memori pribadi)
+    c2 = 1  # Koefisien sosial (pengaruh informasi global)
+    r_minimum = 0  # Batas minimal bilangan acak
+    r_maximum = 1  # Batas maksimal bilangan acak
+    w = 1  # Faktor inersia
+    iteration_amount = 100  # Total iterasi optimasi
+
+    # Inisialisasi dan eksekusi algoritma PSO
+    pso_1_b = PSO_Single_Variable(
+        fitness_function,
+        parameter_minimum,
+        parameter_maximum,
+        particle_amount,
+        c1,
+        c2,
+        r_minimum,
+        r_maximum,
+        w,
+        iteration_amount,
+    )
+
+    pso_1_b.optimize()
+    pso_1_b.show_table()
+    pso_1_b.show_plot_per_iteration()
@@ -3,6 +3,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 from matplotlib.animation import FuncAnimation
+from pso_fitness import PSO_Batch_Fitness, PSO_Parallel_Fitness
+from pso_history import PSO_History
 from tabulate import tabulate
 
 
@@ -19,6 +21,12 @@ class PSO_Multi_Variable:
         r_maximum,  # Batas maksimal bilangan acak untuk eksplorasi
         w,  # Faktor inersia untuk mengontrol dampak kecepatan sebelumnya
         iteration_amount,  # Total iterasi yang akan dilakukan dalam optimasi
+        history_mode="full",  # Pencatatan riwayat: "full", "interval", atau "final"
+        history_interval=1,  # Jarak antar iterasi yang dicatat pada mode "interval"
+        fitness_mode="auto",  # Pemanggilan fitness: "auto", "batch", atau "scalar"
+        fitness_evaluator="serial",  # Evaluasi fitness: "serial", "thread", atau "process"
+        worker_amount=None,  # Jumlah worker pool evaluasi paralel, default jumlah CPU
+        chunk_size=None,  # Jumlah partikel per tugas pada evaluasi paralel
     ):
         # Simpan parameter-parameter algoritma PSO untuk digunakan selama proses optimasi
 
@@ -26,6 +34,22 @@ class PSO_Multi_Variable:
         # Semakin rendah nilainya, semakin baik solusinya
         self.fitness_function = fitness_function
 
+        # Fungsi fitness untuk seluruh swarm sekaligus, lihat PSO_Batch_Fitness
+        # Fungsi skalar (per partikel) tetap didukung melalui np.vectorize
+        # Untuk fungsi objektif yang mahal, evaluasi dapat dibagi ke pool thread atau proses
+        if fitness_evaluator == "serial":
+            self.batch_fitness_function = PSO_Batch_Fitness(
+                fitness_function, fitness_mode
+            )
+        else:
+            self.batch_fitness_function = PSO_Parallel_Fitness(
+                fitness_function,
+                fitness_mode,
+                fitness_evaluator,
+                worker_amount,
+                chunk_size,
+            )
+
         # Batasan ruang pencarian solusi untuk mencegah partikel keluar dari rentang yang valid
         self.parameter_minimum = parameter_minimum
         self.parameter_maximum = parameter_maximum
@@ -53,44 +77,116 @@ class PSO_Multi_Variable:
         # Menentukan berapa lama algoritma mencari solusi optimal
         self.iteration_amount = iteration_amount
 
+        # Mode pencatatan riwayat optimasi, lihat PSO_History
+        # Mode "interval" dan "final" menghemat memori untuk optimasi yang panjang
+        self.history_mode = history_mode
+        self.history_interval = history_interval
+
         # Inisialisasi posisi awal partikel secara acak dalam rentang parameter
         # Setiap partikel memulai dari posisi yang berbeda untuk diversitas
-        self.x = [
+        self.current_x = np.array(
             [
                 round(
                     np.random.uniform(self.parameter_minimum, self.parameter_maximum), 4
                 )
+                for _ in range(self.particle_amount)
             ]
-            for _ in range(self.particle_amount)
-        ]
-        self.y = [
+        )
+        self.current_y = np.array(
             [
                 round(
                     np.random.uniform(self.parameter_minimum, self.parameter_maximum), 4
                 )
+                for _ in range(self.particle_amount)
             ]
-            for _ in range(self.particle_amount)
-        ]
+        )
 
         # Inisialisasi kecepatan awal semua partikel dengan 0
         # Partikel mulai dari kondisi diam sebelum bergerak
-        self.vx = [[0] for _ in range(self.particle_amount)]
-        self.vy = [[0] for _ in range(self.particle_amount)]
+        self.current_vx = np.zeros(self.particle_amount)
+        self.current_vy = np.zeros(self.particle_amount)
 
-        # Struktur untuk menyimpan posisi terbaik pribadi setiap partikel
+        # Posisi terbaik pribadi setiap partikel, diisi pada iterasi pertama
         # Memungkinkan pelacakan pencapaian terbaik setiap partikel
-        self.p_best_x = [[] for _ in range(self.particle_amount)]
-        self.p_best_y = [[] for _ in range(self.particle_amount)]
+        self.current_p_best_x = None
+        self.current_p_best_y = None
 
-        # Struktur untuk menyimpan posisi terbaik global dari seluruh swarm
+        # Posisi terbaik global dari seluruh swarm, diisi pada iterasi pertama
         # Akan diperbarui setiap iterasi jika ditemukan solusi lebih baik
-        self.g_best_x = []
-        self.g_best_y = []
+        self.current_g_best_x = None
+        self.current_g_best_y = None
+
+        # Cache nilai fitness pBest dan gBest, disimpan bersama posisinya
+        # sehingga setiap posisi hanya dievaluasi sekali per iterasi
+        self.current_p_best_fitness = None
+        self.current_g_best_fitness = None
+
+        # Jumlah pemanggilan fungsi fitness (satu per posisi yang dievaluasi)
+        self.evaluation_amount = 0
+
+        # Riwayat posisi, kecepatan, pBest, dan gBest dalam array yang dialokasikan di awal
+        self.reset_history()
+
+    def reset_history(self):
+        # Membuat penyimpan riwayat baru yang dimulai dari posisi dan kecepatan saat ini
+        self.history = PSO_History(
+            self.particle_amount,
+            2,
+            self.iteration_amount,
+            self.history_mode,
+            self.history_interval,
+        )
+        self.history.record_swarm(
+            0,
+            (self.current_x, self.current_y),
+            (self.current_vx, self.current_vy),
+        )
+
+    # Atribut riwayat adalah view dari penyimpan riwayat, dimensi 0 untuk x dan 1 untuk y
+    # Riwayat partikel berbentuk (partikel, iterasi tercatat), gBest berbentuk (iterasi,)
+    # sehingga akses self.x[i][t] pada tabel dan plot tetap berlaku
+    @property
+    def x(self):
+        return self.history.positions[:, :, 0].T
+
+    @property
+    def y(self):
+        return self.history.positions[:, :, 1].T
+
+    @property
+    def vx(self):
+        return self.history.velocities[:, :, 0].T
+
+    @property
+    def vy(self):
+        return self.history.velocities[:, :, 1].T
+
+    @property
+    def p_best_x(self):
+        return self.history.p_best[:, :, 0].T
+
+    @property
+    def p_best_y(self):
+        return self.history.p_best[:, :, 1].T
+
+    @property
+    def g_best_x(self):
+        return self.history.g_best[:, 0]
 
-    def execute_fitness_function(self, x, y):
-        # Menjalankan fungsi fitness dengan pembulatan hasil
-        # Memastikan konsistensi presisi dalam perhitungan
-        return round(self.fitness_function(x, y), 4)
+    @property
+    def g_best_y(self):
+        return self.history.g_best[:, 1]
+
+    def execute_fitness_function_array(self, x, y):
+        # Menjalankan fungsi fitness untuk seluruh posisi sekaligus dengan pembulatan hasil
+        # Hasilnya berupa vektor fitness dengan satu nilai untuk setiap posisi (x, y)
+        self.evaluation_amount += len(x)
+        return np.round(self.batch_fitness_function(x, y), 4)
+
+    def get_fitness_of_positions(self):
+        # Menghitung nilai fitness posisi saat ini untuk seluruh partikel sekaligus
+        # Dijalankan sekali per iterasi, hasilnya dipakai untuk pBest dan disimpan di riwayat
+        return self.execute_fitness_function_array(self.current_x, self.current_y)
 
     def get_color(self, index):
         colors = [
@@ -123,113 +219,133 @@ class PSO_Multi_Variable:
     def get_latest_p_best_x(self):
         # Mengambil posisi terbaik personal terbaru dari setiap partikel
         # Berguna untuk membandingkan dan memperbarui solusi
-        return list(map(lambda arr: arr[-1], self.p_best_x))
+        return self.current_p_best_x
 
     def get_latest_p_best_y(self):
         # Mengambil posisi terbaik personal terbaru dari setiap partikel
         # Berguna untuk membandingkan dan memperbarui solusi
-        return list(map(lambda arr: arr[-1], self.p_best_y))
+        return self.current_p_best_y
 
     def get_latest_fitness_of_p_best(self):
-        # Menghitung nilai fitness dari posisi terbaik personal terbaru
+        # Mengambil nilai fitness dari posisi terbaik personal terbaru dari cache
         # Membantu dalam mengevaluasi kualitas solusi individu
-        return list(
-            map(
-                lambda pair: self.execute_fitness_function(pair[0], pair[1]),
-                list(zip(self.get_latest_p_best_x(), self.get_latest_p_best_y())),
-            )
-        )
+        return self.current_p_best_fitness
 
     def get_best_value_latest_fitness_of_p_best(self):
         # Menemukan nilai fitness terbaik dari posisi personal terbaik
         # Digunakan untuk membandingkan dengan solusi global
-        return min(self.get_latest_fitness_of_p_best())
+        return np.min(self.get_latest_fitness_of_p_best())
 
     def get_latest_g_best_x(self):
         # Mengambil posisi terbaik global terbaru
         # Solusi terbaik yang ditemukan oleh seluruh swarm
-        return self.g_best_x[-1]
+        return self.current_g_best_x
 
     def get_latest_g_best_y(self):
         # Mengambil posisi terbaik global terbaru
         # Solusi terbaik yang ditemukan oleh seluruh swarm
-        return self.g_best_y[-1]
+        return self.current_g_best_y
 
     def get_latest_fitness_of_g_best(self):
-        # Menghitung nilai fitness dari posisi terbaik global
+        # Mengambil nilai fitness dari posisi terbaik global dari cache
         # Mengukur kualitas solusi terbaik keseluruhan
-        return self.execute_fitness_function(
-            self.get_latest_g_best_x(), self.get_latest_g_best_y()
-        )
+        return self.current_g_best_fitness
 
     def set_latest_g_best(self):
         # Proses pemilihan dan pembaruan posisi terbaik global
-        if len(self.g_best_x) == 0 and len(self.g_best_y) == 0:
-            # Pada iterasi pertama, pilih partikel dengan fitness terbaik
-            self.g_best_x.append(
-                self.get_latest_p_best_x()[
-                    np.argmin(self.get_latest_fitness_of_p_best())
-                ]
-            )
+        best_index = np.argmin(self.get_latest_fitness_of_p_best())
 
-            self.g_best_y.append(
-                self.get_latest_p_best_y()[
-                    np.argmin(self.get_latest_fitness_of_p_best())
-                ]
-            )
+        if self.current_g_best_x is None and self.current_g_best_y is None:
+            # Pada iterasi pertama, pilih partikel dengan fitness terbaik
+            self.current_g_best_x = self.get_latest_p_best_x()[best_index]
+            self.current_g_best_y = self.get_latest_p_best_y()[best_index]
+            self.current_g_best_fitness = self.get_latest_fitness_of_p_best()[
+                best_index
+            ]
 
         else:
             # Pada iterasi selanjutnya, perbarui g_best jika ditemukan solusi lebih baik
-            if (self.get_latest_fitness_of_g_best()) <= (
+            # g_best sebelumnya dipertahankan jika tidak ada perbaikan
+            if (self.get_latest_fitness_of_g_best()) > (
                 self.get_best_value_latest_fitness_of_p_best()
             ):
-                # Pertahankan g_best sebelumnya jika tidak ada perbaikan
-                self.g_best_x.append(self.get_latest_g_best_x())
-                self.g_best_y.append(self.get_latest_g_best_y())
-
-            else:
                 # Pilih partikel dengan fitness terbaik sebagai g_best
-                self.g_best_x.append(
-                    self.get_latest_p_best_x()[
-                        np.argmin(self.get_latest_fitness_of_p_best())
-                    ]
-                )
-
-                self.g_best_y.append(
-                    self.get_latest_p_best_y()[
-                        np.argmin(self.get_latest_fitness_of_p_best())
-                    ]
-                )
+                self.current_g_best_x = self.get_latest_p_best_x()[best_index]
+                self.current_g_best_y = self.get_latest_p_best_y()[best_index]
+                self.current_g_best_fitness = self.get_latest_fitness_of_p_best()[
+                    best_index
+                ]
 
     def optimize(self):
         # Algoritma utama Particle Swarm Optimization
         # Melakukan iterasi untuk mengeksplorasi dan mengeksploitasi ruang solusi
+
+        # Riwayat selalu menggambarkan pemanggilan optimize terakhir, sehingga
+        # pemanggilan berikutnya melanjutkan dari posisi saat ini dengan riwayat baru
+        if self.current_g_best_x is not None:
+            self.reset_history()
+
+        # Pool evaluasi fitness paralel hanya hidup selama optimasi berjalan
+        # dan selalu dihentikan dengan rapi, termasuk saat terjadi error
+        try:
+            self.optimize_list()
+            self.record_final_best()
+        finally:
+            self.batch_fitness_function.close()
+
+    def record_final_best(self):
+        # Mencatat pBest dan gBest hasil optimasi pada slot iterasi terakhir
+        # sehingga p_best_x[i][-1], g_best_x[-1], dan pasangan y-nya berisi solusi akhir
+        # Fitness posisi akhir tidak dihitung, sehingga tetap NaN di riwayat
+        if self.current_p_best_x is None:
+            return
+
+        self.history.record_best(
+            self.iteration_amount,
+            (self.current_p_best_x, self.current_p_best_y),
+            (self.current_g_best_x, self.current_g_best_y),
+        )
+        self.history.record_fitness(
+            self.iteration_amount,
+            np.nan,
+            self.current_p_best_fitness,
+            self.current_g_best_fitness,
+        )
+
+    def optimize_list(self):
+        # Versi per partikel dari optimize: kecepatan dan posisi setiap partikel
+        # diperbarui satu per satu dengan nilai skalar
         for t in range(self.iteration_amount):
             # Fase 1: Update Personal Best (pBest)
-            for i in range(self.particle_amount):
-                if len(self.p_best_x[i]) == 0 and len(self.p_best_y[i]) == 0:
-                    # Inisialisasi pBest untuk partikel pada iterasi pertama
-                    self.p_best_x[i].append(self.x[i][-1])
-                    self.p_best_y[i].append(self.y[i][-1])
+            # Fitness posisi saat ini dievaluasi sekali, fitness pBest diambil dari cache
+            fitness = self.get_fitness_of_positions()
 
-                else:
-                    # Perbarui pBest jika posisi saat ini memiliki fitness lebih baik
-                    if (
-                        self.execute_fitness_function(
-                            self.p_best_x[i][-1], self.p_best_y[i][-1]
-                        )
-                    ) <= (self.execute_fitness_function(self.x[i][-1], self.y[i][-1])):
-                        # Pertahankan pBest sebelumnya
-                        self.p_best_x[i].append(self.p_best_x[i][-1])
-                        self.p_best_y[i].append(self.p_best_y[i][-1])
+            if self.current_p_best_x is None and self.current_p_best_y is None:
+                # Inisialisasi pBest untuk seluruh partikel pada iterasi pertama
+                self.current_p_best_x = self.current_x.copy()
+                self.current_p_best_y = self.current_y.copy()
+                self.current_p_best_fitness = fitness.copy()
 
-                    else:
+            else:
+                for i in range(self.particle_amount):
+                    # Perbarui pBest jika posisi saat ini memiliki fitness lebih baik
+                    # pBest sebelumnya dipertahankan jika fitness-nya tidak lebih buruk
+                    if (self.current_p_best_fitness[i]) > (fitness[i]):
                         # Update pBest dengan posisi terbaru
-                        self.p_best_x[i].append(self.x[i][-1])
-                        self.p_best_y[i].append(self.y[i][-1])
+                        self.current_p_best_x[i] = self.current_x[i]
+                        self.current_p_best_y[i] = self.current_y[i]
+                        self.current_p_best_fitness[i] = fitness[i]
 
             # Fase 2: Update Global Best (gBest)
             self.set_latest_g_best()
+            self.history.record_best(
+                t,
+                (self.current_p_best_x, self.current_p_best_y),
+                (self.current_g_best_x, self.current_g_best_y),
+            )
+            self.history.record_fitness(
+                t, fitness, self.current_p_best_fitness, self.current_g_best_fitness
+            )
 
             # Fase 3: Update Kecepatan dan Posisi Partikel
             for i in range(self.particle_amount):
@@ -240,76 +356,82 @@ class PSO_Multi_Variable:
 
                 # Perbarui kecepatan partikel dengan persamaan PSO
                 # Kombinasi dari inersia, kognitif, dan komponen sosial
-                self.vx[i].append(
-                    round(
-                        np.clip(
-                            (
-                                # Inersia: mempertahankan momentum sebelumnya
-                                (self.w * self.vx[i][-1])
-                                # Komponen Kognitif: tarik ke posisi terbaik pribadi
-                                + (
-                                    self.c1
-                                    * r1
-                                    * (self.p_best_x[i][-1] - self.x[i][-1])
-                                )
-                                # Komponen Sosial: tarik ke posisi terbaik global
-                                + (self.c2 * r2 * (self.g_best_x[-1] - self.x[i][-1]))
-                            ),
-                            # Pastikan kecepatan dalam batas yang diizinkan
-                            self.parameter_minimum,
-                            self.parameter_maximum,
+                self.current_vx[i] = round(
+                    np.clip(
+                        (
+                            # Inersia: mempertahankan momentum sebelumnya
+                            (self.w * self.current_vx[i])
+                            # Komponen Kognitif: tarik ke posisi terbaik pribadi
+                            + (
+                                self.c1
+                                * r1
+                                * (self.current_p_best_x[i] - self.current_x[i])
+                            )
+                            # Komponen Sosial: tarik ke posisi terbaik global
+                            + (
+                                self.c2
+                                * r2
+                                * (self.current_g_best_x - self.current_x[i])
+                            )
                         ),
-                        4,
-                    )
+                        # Pastikan kecepatan dalam batas yang diizinkan
+                        self.parameter_minimum,
+                        self.parameter_maximum,
+                    ),
+                    4,
                 )
 
-                self.vy[i].append(
-                    round(
-                        np.clip(
-                            (
-                                # Inersia: mempertahankan momentum sebelumnya
-                                (self.w * self.vy[i][-1])
-                                # Komponen Kognitif: tarik ke posisi terbaik pribadi
-                                + (
-                                    self.c1
-                                    * r1
-                                    * (self.p_best_y[i][-1] - self.y[i][-1])
-                                )
-                                # Komponen Sosial: tarik ke posisi terbaik global
-                                + (self.c2 * r2 * (self.g_best_y[-1] - self.y[i][-1]))
-                            ),
-                            # Pastikan kecepatan dalam batas yang diizinkan
-                            self.parameter_minimum,
-                            self.parameter_maximum,
+                self.current_vy[i] = round(
+                    np.clip(
+                        (
+                            # Inersia: mempertahankan momentum sebelumnya
+                            (self.w * self.current_vy[i])
+                            # Komponen Kognitif: tarik ke posisi terbaik pribadi
+                            + (
+                                self.c1
+                                * r1
+                                * (self.current_p_best_y[i] - self.current_y[i])
+                            )
+                            # Komponen Sosial: tarik ke posisi terbaik global
+                            + (
+                                self.c2
+                                * r2
+                                * (self.current_g_best_y - self.current_y[i])
+                            )
                         ),
-                        4,
-                    )
+                        # Pastikan kecepatan dalam batas yang diizinkan
+                        self.parameter_minimum,
+                        self.parameter_maximum,
+                    ),
+                    4,
                 )
 
                 # Perbarui posisi partikel berdasarkan kecepatan baru
                 # Pastikan posisi masih dalam rentang parameter
-                self.x[i].append(
-                    round(
-                        np.clip(
-                            (self.x[i][-1] + self.vx[i][-1]),
-                            self.parameter_minimum,
-                            self.parameter_maximum,
-                        ),
-                        4,
-                    )
+                self.current_x[i] = round(
+                    np.clip(
+                        (self.current_x[i] + self.current_vx[i]),
+                        self.parameter_minimum,
+                        self.parameter_maximum,
+                    ),
+                    4,
                 )
 
-                self.y[i].append(
-                    round(
-                        np.clip(
-                            (self.y[i][-1] + self.vy[i][-1]),
-                            self.parameter_minimum,
-                            self.parameter_maximum,
-                        ),
-                        4,
-                    )
+                self.current_y[i] = round(
+                    np.clip(
+                        (self.current_y[i] + self.current_vy[i]),
+                        self.parameter_minimum,
+                        self.parameter_maximum,
+                    ),
+                    4,
                 )
 
+            self.history.record_swarm(
+                t + 1,
+                (self.current_x, self.current_y),
+                (self.current_vx, self.current_vy),
+            )
+
     def show_table(self):
         # Fungsi untuk menampilkan rincian proses optimasi dalam tabel
         # Membantu dalam memahami evolusi setiap partikel
@@ -328,7 +450,12 @@ class PSO_Multi_Variable:
         ]
         table = []
 
+        # Tabel menampilkan setiap iterasi beserta posisi sesudahnya
+        if not self.history.is_full():
+            raise ValueError('Tabel per iterasi membutuhkan riwayat dengan mode "full"')
+
         # Susun data untuk setiap iterasi dan partikel
+        # Nilai fitness diambil dari riwayat, sehingga fungsi fitness tidak dijalankan lagi
         for t in range(self.iteration_amount):
             first_row = True
             for i in range(self.particle_amount):
@@ -337,24 +464,16 @@ class PSO_Multi_Variable:
                         t + 1 if first_row else "",
                         f"Ke-{i + 1} ({i})",
                         f"({self.x[i][t]}, {self.y[i][t]})",
-                        self.execute_fitness_function(self.x[i][t], self.y[i][t]),
+                        self.history.fitness[t, i],
                         f"({self.vx[i][t]}, {self.vy[i][t]})",
                         f"({self.p_best_x[i][t]}, {self.p_best_y[i][t]})",
-                        self.execute_fitness_function(
-                            self.p_best_x[i][t], self.p_best_y[i][t]
-                        ),
+                        self.history.p_best_fitness[t, i],
                         (
                             f"({self.g_best_x[t]}, {self.g_best_y[t]})"
                             if first_row
                             else ""
                         ),
-                        (
-                            self.execute_fitness_function(
-                                self.g_best_x[t], self.g_best_y[t]
-                            )
-                            if first_row
-                            else ""
-                        ),
+                        self.history.g_best_fitness[t] if first_row else "",
                         f"({self.x[i][t + 1]}, {self.y[i][t + 1]})",
                         f"({self.vx[i][t + 1]}, {self.vy[i][t + 1]})",
                     ]
@@ -423,7 +542,8 @@ class PSO_Multi_Variable:
             arrows.append(arrow_temp)
 
         def update(frame):
-            print(f"Iterasi Ke-{frame + show_amout}")
+            # Frame adalah slot riwayat, tampilkan nomor iterasi yang tercatat
+            print(f"Iterasi Ke-{self.history.iterations[frame + show_amout]}")
 
             # Fungsi update untuk animasi pergerakan
             # Memperbarui posisi setiap partikel pada setiap frame
@@ -457,7 +577,7 @@ class PSO_Multi_Variable:
         ani = FuncAnimation(
             fig,
             update,
-            frames=range(self.iteration_amount + 1 - show_amout),
+            frames=range(len(self.history.iterations) - show_amout),
             interval=5,  # Kontrol kecepatan animasi
             blit=True,  # Optimasi performa animasi
         )
@@ -466,40 +586,42 @@ class PSO_Multi_Variable:
         plt.show()
 
 
-# Definisi fungsi fitness untuk dioptimasi
-# Dalam kasus ini: f(x) = (1.25 - x + xy)² + (2.5 - x + xy²)² + (0.5 - x + xy³)²
-# Fungsi ini memiliki beberapa minimum lokal dan global
-fitness_function = lambda x, y: (
-    ((1.25 - x + (x * y)) ** 2)
-    + ((2.5 - x + (x * (y**2))) ** 2)
-    + ((0.5 - x + (x * (y**3))) ** 2)
-)
-
-# Parameter optimasi PSO yang akan digunakan
-parameter_minimum = -3.5  # Batas minimal pencarian solusi
-parameter_maximum = 3.5  # Batas maksimal pencarian solusi
-particle_amount = 10  # Jumlah partikel dalam swarm
-c1 = 1  # Koefisien kognitif (pengaruh memori pribadi)
-c2 = 1  # Koefisien sosial (pengaruh informasi global)
-r_minimum = 0  # Batas minimal bilangan acak
-r_maximum = 1  # Batas maksimal bilangan acak
-w = 1  # Faktor inersia
-iteration_amount = 1000  # Total iterasi optimasi
-
-# Inisialisasi dan eksekusi algoritma PSO
-pso_kelompok_2_soal_2_bagian_b = PSO_Multi_Variable(
-    fitness_function,
-    parameter_minimum,
-    parameter_maximum,
-    particle_amount,
-    c1,
-    c2,
-    r_minimum,
-    r_maximum,
-    w,
-    iteration_amount,
-)
-
-pso_kelompok_2_soal_2_bagian_b.optimize()
-pso_kelompok_2_soal_2_bagian_b.show_table()
-pso_kelompok_2_soal_2_bagian_b.show_scatter_plot_per_iteration()
+# Script hanya dijalankan langsung, agar kelas dapat di-import tanpa menjalankan demo
+if __name__ == "__main__":
+    # Definisi fungsi fitness untuk dioptimasi
+    # Dalam kasus ini: f(x) = (1.25 - x + xy)² + (2.5 - x + xy²)² + (0.5 - x + xy³)²
+    # Fungsi ini memiliki beberapa minimum lokal dan global
+    fitness_function = lambda x, y: (
+        ((1.25 - x + (x * y)) ** 2)
+        + ((2.5 - x + (x * (y**2))) ** 2)
+        + ((0.5 - x + (x * (y**3))) ** 2)
+    )
+
+    # Parameter optimasi PSO yang akan digunakan
+    parameter_minimum = -3.5  # Batas minimal pencarian solusi
+    parameter_maximum = 3.5  # Batas maksimal pencarian solusi
+    particle_amount = 10  # Jumlah partikel dalam swarm
+    c1 = 1  # Koefisien kognitif (pengaruh memori pribadi)
+    c2 = 1  # Koefisien sosial (pengaruh informasi global)
+    r_minimum = 0  # Batas minimal bilangan acak
+    r_maximum = 1  # Batas maksimal bilangan acak
+    w = 1  # Faktor inersia
+    iteration_amount = 1000  # Total iterasi optimasi
+
+    # Inisialisasi dan eksekusi algoritma PSO
+    pso_kelompok_2_soal_2_bagian_b = PSO_Multi_Variable(
+        fitness_function,
+        parameter_minimum,
+        parameter_maximum,
+        particle_amount,
+        c1,
+        c2,
+        r_minimum,
+        r_maximum,
+        w,
+        iteration_amount,
+    )
+
+    pso_kelompok_2_soal_2_bagian_b.optimize()
+    pso_kelompok_2_soal_2_bagian_b.show_table()
+    pso_kelompok_2_soal_2_bagian_b.show_scatter_plot_per_iteration()
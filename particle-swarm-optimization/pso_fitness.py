@@ -0,0 +1,169 @@
+import math
+import multiprocessing
+import numpy as np
+import os
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Fungsi fitness milik proses worker, diisi oleh initializer saat worker dibuat
+# Dengan start method "fork" fungsi diwariskan tanpa pickle, sehingga lambda tetap dapat dipakai
+_worker_fitness_function = None
+
+
+def _initialize_worker(batch_fitness_function):
+    global _worker_fitness_function
+    _worker_fitness_function = batch_fitness_function
+
+
+def _evaluate_chunk(*positions):
+    # Menghitung fitness satu chunk partikel di proses worker
+    return _worker_fitness_function(*positions)
+
+
+class PSO_Batch_Fitness:
+    def __init__(
+        self,
+        fitness_function,  # Fungsi objektif, menerima satu argumen untuk setiap variabel
+        mode="auto",  # Cara pemanggilan: "auto", "batch", atau "scalar"
+    ):
+        # Pembungkus fungsi fitness agar seluruh swarm dievaluasi dengan satu pemanggilan
+        # "batch": fungsi menerima array posisi (partikel,) dan mengembalikan vektor fitness
+        # "scalar": fungsi menerima satu posisi, dijalankan per partikel dengan np.vectorize
+        # "auto": coba "batch" pada pemanggilan pertama, pindah ke "scalar" jika gagal
+        if mode not in ("auto", "batch", "scalar"):
+            raise ValueError(f"Mode fitness tidak dikenal: {mode}")
+
+        self.fitness_function = fitness_function
+        self.mode = mode
+
+        # otypes ditentukan agar np.vectorize tidak memanggil fungsi tambahan
+        # untuk menebak tipe hasil, sehingga setiap posisi dievaluasi tepat sekali
+        self.vectorized_fitness_function = np.vectorize(
+            self.fitness_function, otypes=[float]
+        )
+
+    def __call__(self, *positions):
+        # Menghitung fitness seluruh partikel, positions berisi satu array (partikel,)
+        # untuk setiap variabel, hasilnya berupa vektor fitness (partikel,)
+        if self.mode == "scalar":
+            return self.vectorized_fitness_function(*positions)
+
+        if self.mode == "batch":
+            fitness = np.asarray(self.fitness_function(*positions), dtype=float)
+            if fitness.shape != np.shape(positions[0]):
+                raise ValueError(
+                    f"Fungsi fitness batch harus mengembalikan {np.shape(positions[0])} nilai, "
+                    f"bukan {fitness.shape}"
+                )
+
+            return fitness
+
+        # Mode "auto": fungsi yang gagal menerima array (misalnya memakai if, math,
+        # atau mengembalikan satu nilai) dijalankan ulang per partikel
+        try:
+            fitness = np.asarray(self.fitness_function(*positions), dtype=float)
+        except Exception:
+            fitness = None
+
+        if fitness is None or fitness.shape != np.shape(positions[0]):
+            self.mode = "scalar"
+            return self.vectorized_fitness_function(*positions)
+
+        self.mode = "batch"
+        return fitness
+
+    def close(self):
+        # Evaluasi berjalan di proses utama, tidak ada worker yang perlu dihentikan
+        pass
+
+
+class PSO_Parallel_Fitness:
+    def __init__(
+        self,
+        fitness_function,  # Fungsi objektif, menerima satu argumen untuk setiap variabel
+        mode="auto",  # Cara pemanggilan di worker: "auto", "batch", atau "scalar"
+        executor="process",  # Jenis pool: "process" atau "thread"
+        worker_amount=None,  # Jumlah worker, default sesuai jumlah CPU
+        chunk_size=None,  # Jumlah partikel per tugas, default dibagi rata ke 4 tugas per worker
+    ):
+        # Evaluasi fitness paralel untuk fungsi objektif yang mahal (misalnya simulasi)
+        # Partikel dibagi menjadi chunk, setiap chunk dievaluasi oleh worker dari pool
+        # concurrent.futures, lalu hasilnya digabung kembali sesuai urutan partikel
+        if executor not in ("process", "thread"):
+            raise ValueError(f"Executor tidak dikenal: {executor}")
+
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("Ukuran chunk minimal 1")
+
+        self.batch_fitness_function = PSO_Batch_Fitness(fitness_function, mode)
+        self.executor = executor
+        self.worker_amount = worker_amount or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+        # Pool dibuat saat evaluasi pertama dan dihentikan oleh close()
+        self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def start(self):
+        # Membuat pool worker jika belum ada
+        if self.pool is not None:
+            return
+
+        if self.executor == "thread":
+            self.pool = ThreadPoolExecutor(self.worker_amount)
+            return
+
+        # Gunakan "fork" jika tersedia agar fungsi fitness tidak perlu di-pickle
+        # Pada platform lain fungsi fitness harus berupa fungsi tingkat modul
+        context = None
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+
+        self.pool = ProcessPoolExecutor(
+            self.worker_amount,
+            mp_context=context,
+            initializer=_initialize_worker,
+            initargs=(self.batch_fitness_function,),
+        )
+
+    def __call__(self, *positions):
+        # Menghitung fitness seluruh partikel secara paralel, hasilnya vektor (partikel,)
+        self.start()
+
+        particle_amount = len(positions[0])
+        chunk_size = self.chunk_size or max(
+            1, math.ceil(particle_amount / (self.worker_amount * 4))
+        )
+
+        # Worker thread berbagi memori, sehingga fungsi dapat dipanggil langsung
+        function = (
+            _evaluate_chunk
+            if self.executor == "process"
+            else self.batch_fitness_function
+        )
+
+        futures = [
+            self.pool.submit(
+                function,
+                *(position[start : start + chunk_size] for position in positions),
+            )
+            for start in range(0, particle_amount, chunk_size)
+        ]
+
+        # Hasil digabung sesuai urutan chunk, bukan urutan selesai, agar hasilnya deterministik
+        if len(futures) == 0:
+            return np.empty(0)
+
+        return np.concatenate([future.result() for future in futures])
+
+    def close(self):
+        # Menghentikan pool dengan rapi: tugas yang belum berjalan dibatalkan,
+        # tugas yang sedang berjalan ditunggu sampai selesai
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
@@ -0,0 +1,111 @@
+import numpy as np
+
+
+class PSO_History:
+    def __init__(
+        self,
+        particle_amount,  # Jumlah partikel dalam swarm (populasi)
+        dimension_amount,  # Jumlah variabel (dimensi) pada setiap posisi partikel
+        iteration_amount,  # Total iterasi yang akan dilakukan dalam optimasi
+        mode="full",  # Mode pencatatan: "full", "interval", atau "final"
+        interval=1,  # Jarak antar iterasi yang dicatat pada mode "interval"
+    ):
+        # Penyimpan riwayat optimasi PSO dalam array NumPy yang dialokasikan di awal
+        # sehingga setiap iterasi hanya menulis ke slot, tanpa membuat list atau float baru
+
+        # Mode pencatatan riwayat swarm (posisi, kecepatan, dan pBest)
+        # "full": setiap iterasi, "interval": setiap k iterasi, "final": hanya awal dan akhir
+        if mode not in ("full", "interval", "final"):
+            raise ValueError(f"Mode riwayat tidak dikenal: {mode}")
+
+        if interval < 1:
+            raise ValueError("Interval riwayat minimal 1")
+
+        self.mode = mode
+        self.interval = interval
+        self.particle_amount = particle_amount
+        self.dimension_amount = dimension_amount
+        self.iteration_amount = iteration_amount
+
+        # Iterasi yang dicatat, posisi awal (0) dan posisi akhir selalu ikut dicatat
+        if self.mode == "full":
+            self.iterations = np.arange(self.iteration_amount + 1)
+        elif self.mode == "interval":
+            self.iterations = np.union1d(
+                np.arange(0, self.iteration_amount + 1, self.interval),
+                [self.iteration_amount],
+            )
+        else:
+            self.iterations = np.union1d([0], [self.iteration_amount])
+
+        # Slot penyimpanan untuk setiap iterasi, -1 jika iterasi tersebut tidak dicatat
+        self.slot_of_iteration = np.full(self.iteration_amount + 1, -1)
+        self.slot_of_iteration[self.iterations] = np.arange(len(self.iterations))
+
+        # Array riwayat swarm berbentuk (iterasi tercatat, partikel, dimensi)
+        # pBest dan gBest pada iterasi terakhir berisi hasil akhir optimasi (dicatat setelah iterasi terakhir)
+        shape = (len(self.iterations), self.particle_amount, self.dimension_amount)
+        self.positions = np.full(shape, np.nan)
+        self.velocities = np.full(shape, np.nan)
+        self.p_best = np.full(shape, np.nan)
+
+        # Nilai fitness posisi dan pBest yang sudah dihitung, berbentuk (iterasi tercatat, partikel)
+        # Disimpan agar tabel tidak perlu menjalankan fungsi fitness lagi
+        self.fitness = np.full(shape[:2], np.nan)
+        self.p_best_fitness = np.full(shape[:2], np.nan)
+
+        # gBest selalu dicatat di setiap iterasi karena ukurannya hanya (iterasi, dimensi)
+        self.g_best = np.full(
+            (self.iteration_amount + 1, self.dimension_amount), np.nan
+        )
+        self.g_best_fitness = np.full(self.iteration_amount + 1, np.nan)
+
+    def is_full(self):
+        # Mengecek apakah setiap iterasi tercatat, dibutuhkan oleh tabel per iterasi
+        return len(self.iterations) == self.iteration_amount + 1
+
+    def record_swarm(self, iteration, positions, velocities):
+        # Mencatat posisi dan kecepatan seluruh partikel pada sebuah iterasi
+        # positions dan velocities berisi satu array (partikel,) untuk setiap dimensi
+        slot = self.slot_of_iteration[iteration]
+        if slot < 0:
+            return
+
+        for dimension in range(self.dimension_amount):
+            self.positions[slot, :, dimension] = positions[dimension]
+            self.velocities[slot, :, dimension] = velocities[dimension]
+
+    def record_best(self, iteration, p_best, g_best):
+        # Mencatat pBest seluruh partikel dan gBest swarm pada sebuah iterasi
+        # p_best berisi satu array (partikel,) dan g_best satu nilai untuk setiap dimensi
+        self.g_best[iteration] = g_best
+
+        slot = self.slot_of_iteration[iteration]
+        if slot < 0:
+            return
+
+        for dimension in range(self.dimension_amount):
+            self.p_best[slot, :, dimension] = p_best[dimension]
+
+    def record_fitness(self, iteration, fitness, p_best_fitness, g_best_fitness):
+        # Mencatat nilai fitness posisi, pBest, dan gBest yang dihitung pada sebuah iterasi
+        self.g_best_fitness[iteration] = g_best_fitness
+
+        slot = self.slot_of_iteration[iteration]
+        if slot < 0:
+            return
+
+        self.fitness[slot] = fitness
+        self.p_best_fitness[slot] = p_best_fitness
+
+    def get_nbytes(self):
+        # Menghitung total memori array riwayat dalam byte
+        return (
+            self.positions.nbytes
+            + self.velocities.nbytes
+            + self.p_best.nbytes
+            + self.fitness.nbytes
+            + self.p_best_fitness.nbytes
+            + self.g_best.nbytes
+            + self.g_best_fitness.nbytes
+        )